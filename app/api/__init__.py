@@ -1,5 +1,6 @@
 from fastapi import APIRouter
 from app.api import categories, legal_acts, graph, chat, status, debug_env
+from app.core.config import settings
 
 router = APIRouter()
 
@@ -8,5 +9,8 @@ router.include_router(categories.router, prefix="/categories", tags=["categories
 router.include_router(legal_acts.router, prefix="/legal-acts", tags=["legal-acts"])
 router.include_router(graph.router, prefix="/graph", tags=["graph"])
 router.include_router(chat.router, prefix="/chat", tags=["chat"])
-router.include_router(debug_env.router, prefix="/debug", tags=["debug"])
+
+# Debug endpoints expose environment details - never in production
+if settings.DEBUG:
+    router.include_router(debug_env.router, prefix="/debug", tags=["debug"])
 
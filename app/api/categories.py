@@ -2,13 +2,15 @@
 API endpoints for categories
 """
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List
 import logging
-from app.core.database import get_db
+from app.core.database import get_async_db
 from app.models.category import Category
 from app.services.neo4j_service import neo4j_service
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -21,35 +23,27 @@ class CategoryResponse(BaseModel):
     description: str | None = None
     element_count: int = 0
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
+
+
+# Category list columns, already in the CategoryResponse shape - trusted database rows
+# are serialized as-is instead of being validated into a model per category
+_CATEGORY_COLUMNS = select(
+    Category.id,
+    Category.name,
+    Category.code,
+    Category.description,
+    func.coalesce(Category.element_count, 0).label("element_count")
+)
 
 
 @router.get("/", response_model=List[CategoryResponse])
-async def get_categories(db: Session = Depends(get_db)):
+async def get_categories(db: AsyncSession = Depends(get_async_db)):
     """Get all categories"""
     try:
-        # Ensure tables exist
-        from app.core.database import Base, engine
-        Base.metadata.create_all(bind=engine)
-        
-        # Try to add code column if it doesn't exist (for existing databases)
-        try:
-            from sqlalchemy import inspect, text
-            inspector = inspect(engine)
-            columns = [col['name'] for col in inspector.get_columns('categories')]
-            if 'code' not in columns:
-                logger.warning("Column 'code' not found in categories table, adding it...")
-                with engine.connect() as conn:
-                    conn.execute(text("ALTER TABLE categories ADD COLUMN code INTEGER"))
-                    conn.commit()
-                logger.info("Column 'code' added successfully")
-        except Exception as migration_error:
-            # Column might already exist or migration failed, continue
-            logger.debug(f"Migration check: {migration_error}")
-        
-        categories = db.query(Category).all()
-        return categories
+        # Schema (including the 'code' column) is migrated on startup, see app/core/migrations.py
+        categories = (await db.execute(_CATEGORY_COLUMNS)).mappings().all()
+        return ORJSONResponse([dict(category) for category in categories])
     except Exception as e:
         logger.error(f"Error getting categories: {e}", exc_info=True)
         raise HTTPException(
@@ -59,24 +53,23 @@ async def get_categories(db: Session = Depends(get_db)):
 
 
 @router.get("/{category_id}", response_model=CategoryResponse)
-async def get_category(category_id: int, db: Session = Depends(get_db)):
+async def get_category(category_id: int, db: AsyncSession = Depends(get_async_db)):
     """Get category by ID"""
-    category = db.query(Category).filter(Category.id == category_id).first()
+    category = await db.get(Category, category_id)
     if not category:
         raise HTTPException(status_code=404, detail="Category not found")
     return category
 
 
 @router.get("/{category_id}/statistics")
-async def get_category_statistics(category_id: int, db: Session = Depends(get_db)):
+async def get_category_statistics(category_id: int, db: AsyncSession = Depends(get_async_db)):
     """Get statistics for a category"""
-    category = db.query(Category).filter(Category.id == category_id).first()
+    category = await db.get(Category, category_id)
     if not category:
         raise HTTPException(status_code=404, detail="Category not found")
     
     # Get from Neo4j
-    stats = neo4j_service.get_category_statistics()
-    category_stats = next((s for s in stats if s["id"] == category_id), None)
+    category_stats = neo4j_service.get_category_statistics_by_id().get(category_id)
     
     return {
         "category": {
@@ -1,22 +1,67 @@
 """
 API endpoints for chat with OpenAI
 """
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from sqlalchemy import or_, func
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import String, and_, bindparam, cast, or_, func, literal_column, select
+from sqlalchemy.orm import load_only
 from typing import List, Optional, Dict, Any
-from app.core.database import get_db
+from app.core.database import AsyncSessionLocal, is_postgres
+from app.core.cache import cache_get, cache_set
+from app.core.config import settings
 from app.models.category import Category
 from app.models.legal_act import LegalAct, ActCategory
-from app.services.openai_service import openai_service
+from app.services.openai_service import CHAT_ERROR_MESSAGE, openai_service
 from app.services.neo4j_service import neo4j_service
 from pydantic import BaseModel
+from cachetools import TTLCache
+import asyncio
+import hashlib
+import json
 import logging
+import orjson
 import re
+import threading
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Generated tsvector column (see app/core/migrations.py), not mapped on the model
+_SEARCH_VECTOR = literal_column("legal_acts.search_vector")
+_FTS_CONFIG = literal_column("'simple'::regconfig")
+_WORD_RE = re.compile(r"\w+")
+
+# Potential registration numbers in a question (e.g. 254к/96-ВР, 2341-III)
+_NREG_RE = re.compile(r'\b\d+[-/]?[А-ЯІЇЄа-яіїєA-Za-z]+\b|\b\d+[-/]\d+\b')
+# Cyrillic/Latin lookalike letters commonly mixed up in nreg
+_CYR_TO_LAT = str.maketrans('кКвВрРіІхХ', 'kKvVrRiIxX')
+_LAT_TO_CYR = str.maketrans('kKvVrRiIxX', 'кКвВрРіІхХ')
+
+# Columns serialized into the chat context - never pull the full act text
+_ACT_SUMMARY = load_only(
+    LegalAct.id, LegalAct.nreg, LegalAct.title, LegalAct.document_type, LegalAct.status,
+    LegalAct.is_processed, LegalAct.date_acceptance, LegalAct.date_publication,
+    LegalAct.extracted_elements, LegalAct.extracted_relations
+)
+
+# Full-text search statements are built once; per request only the bound
+# parameters change, so SQLAlchemy reuses the compiled SQL from its cache
+_TS_QUERY = func.to_tsquery(_FTS_CONFIG, bindparam("ts_query"))
+_FTS_ACTS_STMT = select(LegalAct).options(_ACT_SUMMARY).where(
+    _SEARCH_VECTOR.op("@@")(_TS_QUERY)
+).order_by(
+    func.ts_rank_cd(_SEARCH_VECTOR, _TS_QUERY).desc()
+).limit(bindparam("limit"))
+_FTS_PROCESSED_STMT = select(LegalAct).options(_ACT_SUMMARY).where(
+    LegalAct.is_processed == True,
+    func.to_tsvector(_FTS_CONFIG, LegalAct.extracted_elements).op("@@")(_TS_QUERY)
+).limit(bindparam("limit"))
+
+# Database-wide counts change slowly, no need to recount on every chat request
+_stats_cache = TTLCache(maxsize=1, ttl=settings.DB_STATS_CACHE_TTL)
+_stats_lock = threading.Lock()
+
 
 class ChatRequest(BaseModel):
     question: str
@@ -42,84 +87,99 @@ def normalize_nreg_for_search(nreg: str) -> List[str]:
     if nreg != nreg.lower():
         variations.append(nreg.lower())
     
-    # Cyrillic/Latin conversions for common letters
-    cyr_to_lat = {'к': 'k', 'К': 'K', 'в': 'v', 'В': 'V', 'р': 'r', 'Р': 'R', 'і': 'i', 'І': 'I', 'х': 'x', 'Х': 'X'}
-    lat_to_cyr = {v: k for k, v in cyr_to_lat.items()}
-    
     # Convert Cyrillic to Latin
-    lat_nreg = nreg
-    for cyr, lat in cyr_to_lat.items():
-        lat_nreg = lat_nreg.replace(cyr, lat)
+    lat_nreg = nreg.translate(_CYR_TO_LAT)
     if lat_nreg != nreg and lat_nreg not in variations:
         variations.append(lat_nreg)
         variations.append(lat_nreg.upper())
         variations.append(lat_nreg.lower())
     
     # Convert Latin to Cyrillic
-    cyr_nreg = nreg
-    for lat, cyr in lat_to_cyr.items():
-        cyr_nreg = cyr_nreg.replace(lat, cyr)
+    cyr_nreg = nreg.translate(_LAT_TO_CYR)
     if cyr_nreg != nreg and cyr_nreg not in variations:
         variations.append(cyr_nreg)
         variations.append(cyr_nreg.upper())
         variations.append(cyr_nreg.lower())
     
-    return list(set(variations))  # Remove duplicates
+    return list(dict.fromkeys(variations))  # Remove duplicates, keep original first
+
+
+def build_ts_query(keywords: List[str]) -> str:
+    """Build a to_tsquery() expression matching any keyword by prefix"""
+    # Keep only word characters - tsquery operators (&, |, !, :, parentheses) would break parsing
+    words = dict.fromkeys(word for kw in keywords for word in _WORD_RE.findall(kw))
+    return " | ".join(f"{word}:*" for word in words)
 
 
-def search_relevant_acts(question: str, db: Session, limit: int = 10) -> List[Dict[str, Any]]:
+async def search_relevant_acts(question: str, db: AsyncSession, limit: int = 10) -> List[Dict[str, Any]]:
     """Search for relevant legal acts based on question"""
     try:
         # First, try to find exact nreg match (with normalization)
         # Extract potential nreg from question (numbers with optional letters/dashes)
-        import re
-        nreg_pattern = r'\b\d+[-/]?[А-ЯІЇЄа-яіїєA-Za-z]+\b|\b\d+[-/]\d+\b'
-        potential_nregs = re.findall(nreg_pattern, question)
+        potential_nregs = _NREG_RE.findall(question)
         
         exact_matches = []
-        if potential_nregs:
-            for potential_nreg in potential_nregs:
-                # Normalize and search
-                nreg_variations = normalize_nreg_for_search(potential_nreg)
-                for nreg_var in nreg_variations:
-                    act = db.query(LegalAct).filter(LegalAct.nreg == nreg_var).first()
-                    if act:
-                        exact_matches.append(act)
-                        logger.info(f"Found exact nreg match: {nreg_var} -> {act.nreg}")
-                        break
+        # All normalized variations in one IN query (nreg is uniquely indexed)
+        all_variations = {v for n in potential_nregs for v in normalize_nreg_for_search(n)}
+        if all_variations:
+            exact_matches = list(await db.scalars(
+                select(LegalAct).options(_ACT_SUMMARY).where(LegalAct.nreg.in_(all_variations))
+            ))
+            for act in exact_matches:
+                logger.info(f"Found exact nreg match: {act.nreg}")
         
         # Split question into keywords for better search
-        keywords = question.lower().split()
-        keywords = [kw for kw in keywords if len(kw) > 2]  # Filter short words
+        keywords = [kw for kw in question.casefold().split() if len(kw) > 2]  # Filter short words
         
-        # Search in title and text (also try normalized nreg variations)
+        # Search nreg by substring (also try normalized nreg variations)
         nreg_filters = [LegalAct.nreg.ilike(f"%{question}%")]
         # Add normalized variations
         nreg_variations = normalize_nreg_for_search(question)
         for nreg_var in nreg_variations[:5]:  # Limit to avoid too many filters
             nreg_filters.append(LegalAct.nreg.ilike(f"%{nreg_var}%"))
-        
-        acts = db.query(LegalAct).filter(
-            or_(
-                *[LegalAct.title.ilike(f"%{kw}%") for kw in keywords],
-                *[LegalAct.text.ilike(f"%{kw}%") for kw in keywords],
-                *nreg_filters
-            )
-        ).limit(limit * 2).all()  # Get more to filter by relevance
-        
-        # Also search in extracted elements for processed acts
-        processed_acts = db.query(LegalAct).filter(
-            LegalAct.is_processed == True,
-            LegalAct.extracted_elements.isnot(None)
-        ).limit(limit * 2).all()
-        
-        # Check if extracted elements contain keywords
+
+        acts = list(await db.scalars(select(LegalAct).options(_ACT_SUMMARY).where(or_(*nreg_filters)).limit(limit)))
+
         relevant_processed = []
-        for act in processed_acts:
-            if act.extracted_elements:
-                elements_str = str(act.extracted_elements).lower()
-                if any(kw in elements_str for kw in keywords):
-                    relevant_processed.append(act)
+        if is_postgres:
+            ts_query = build_ts_query(keywords)
+            if ts_query:
+                # Search in title and text: full-text search over the GIN-indexed
+                # search_vector, ranked by relevance
+                acts += await db.scalars(_FTS_ACTS_STMT, {"ts_query": ts_query, "limit": limit})
+
+                # Also search in extracted elements for processed acts
+                # (matches the legal_acts_elements_fts_idx expression index)
+                relevant_processed = list(await db.scalars(
+                    _FTS_PROCESSED_STMT, {"ts_query": ts_query, "limit": limit * 2}
+                ))
+        elif keywords:
+            # SQLite has no full-text index, fall back to substring search
+            acts += await db.scalars(
+                select(LegalAct).options(_ACT_SUMMARY).where(
+                    or_(
+                        *[LegalAct.title.ilike(f"%{kw}%") for kw in keywords],
+                        *[LegalAct.text.ilike(f"%{kw}%") for kw in keywords]
+                    )
+                ).limit(limit * 2)
+            )
+
+            # Also search in extracted elements for processed acts
+            processed_acts = await db.scalars(
+                select(LegalAct).options(_ACT_SUMMARY).where(
+                    LegalAct.is_processed == True,
+                    LegalAct.extracted_elements.isnot(None)
+                ).limit(limit * 2)
+            )
+
+            # Check if extracted elements contain keywords - one alternation
+            # matches all keywords in a single pass over each act
+            keywords_re = re.compile("|".join(map(re.escape, keywords)))
+            for act in processed_acts:
+                if act.extracted_elements:
+                    elements_str = orjson.dumps(act.extracted_elements).decode().lower()
+                    if keywords_re.search(elements_str):
+                        relevant_processed.append(act)
         
         # Combine and deduplicate (exact matches first, then others)
         all_acts = exact_matches + list(acts) + relevant_processed
@@ -163,75 +223,75 @@ def search_relevant_acts(question: str, db: Session, limit: int = 10) -> List[Di
         return []
 
 
-def search_relevant_categories(question: str, db: Session) -> List[Dict[str, Any]]:
+async def search_relevant_categories(question: str, db: AsyncSession) -> List[Dict[str, Any]]:
     """Search for relevant categories based on question"""
     try:
-        categories = db.query(Category).filter(
-            Category.name.ilike(f"%{question}%")
-        ).limit(5).all()
-        
-        result = []
-        for cat in categories:
-            # Get acts count for this category
-            acts_count = db.query(func.count(ActCategory.act_id)).filter(
-                ActCategory.category_id == cat.id
-            ).scalar() or 0
-            
-            result.append({
+        # Fetch categories together with their acts count in one query
+        rows = await db.execute(
+            select(
+                Category,
+                func.count(ActCategory.act_id)
+            ).outerjoin(
+                ActCategory, ActCategory.category_id == Category.id
+            ).where(
+                Category.name.ilike(f"%{question}%")
+            ).group_by(Category.id).limit(5)
+        )
+
+        return [
+            {
                 "id": cat.id,
                 "name": cat.name,
                 "element_count": cat.element_count,
                 "acts_count": acts_count
-            })
-        return result
+            }
+            for cat, acts_count in rows
+        ]
     except Exception as e:
         logger.error(f"Error searching categories: {e}")
         return []
 
 
-def get_database_statistics(db: Session) -> Dict[str, Any]:
-    """Get general database statistics"""
+async def get_database_statistics(db: AsyncSession) -> Dict[str, Any]:
+    """Get general database statistics (cached for settings.DB_STATS_CACHE_TTL seconds)"""
+    with _stats_lock:
+        cached = _stats_cache.get("stats")
+    if cached is not None:
+        return cached
+
     try:
-        total_acts = db.query(func.count(LegalAct.id)).scalar() or 0
-        processed_acts = db.query(func.count(LegalAct.id)).filter(
-            LegalAct.is_processed == True
-        ).scalar() or 0
-        total_categories = db.query(func.count(Category.id)).scalar() or 0
-        
-        return {
+        # All three counts in a single round trip
+        row = (await db.execute(
+            select(
+                select(func.count(LegalAct.id)).scalar_subquery().label("total_acts"),
+                select(func.count(LegalAct.id)).where(
+                    LegalAct.is_processed == True
+                ).scalar_subquery().label("processed_acts"),
+                select(func.count(Category.id)).scalar_subquery().label("total_categories")
+            )
+        )).one()
+        total_acts = row.total_acts or 0
+        processed_acts = row.processed_acts or 0
+        total_categories = row.total_categories or 0
+
+        stats = {
             "total_acts": total_acts,
             "processed_acts": processed_acts,
             "total_categories": total_categories,
             "processing_rate": round((processed_acts / total_acts * 100) if total_acts > 0 else 0, 2)
         }
+        with _stats_lock:
+            _stats_cache["stats"] = stats
+        return stats
     except Exception as e:
         logger.error(f"Error getting statistics: {e}")
         return {}
 
 
-@router.post("/", response_model=ChatResponse)
-async def chat(
-    request: ChatRequest,
-    db: Session = Depends(get_db)
-):
-    """Chat about legal acts, categories, and relations using database data"""
-    
-    # Build context from database
-    context = {
-        "database_statistics": get_database_statistics(db)
-    }
-    
-    # Search for relevant acts and categories based on question
-    relevant_acts = search_relevant_acts(request.question, db, limit=10)  # Increased from 5 to 10
-    relevant_categories = search_relevant_categories(request.question, db)
-    
-    context["relevant_acts"] = relevant_acts
-    context["relevant_categories"] = relevant_categories
-    
-    # ALWAYS include list of all acts in database (for general questions)
-    # This ensures chat has access to all loaded acts, not just search results
-    all_acts = db.query(LegalAct).order_by(LegalAct.nreg).limit(100).all()  # Get up to 100 acts
-    context["all_acts_in_database"] = [
+async def get_all_acts_overview(db: AsyncSession, limit: int = 100) -> List[Dict[str, Any]]:
+    """List acts in database (for general questions)"""
+    all_acts = await db.scalars(select(LegalAct).options(_ACT_SUMMARY).order_by(LegalAct.nreg).limit(limit))
+    return [
         {
             "nreg": act.nreg,
             "title": act.title,
@@ -242,81 +302,86 @@ async def chat(
         }
         for act in all_acts
     ]
-    logger.info(f"Added {len(context['all_acts_in_database'])} acts to context (total in DB: {get_database_statistics(db).get('total_acts', 0)})")
-    
-    # If specific categories requested, get their info
-    if request.category_ids:
-        categories = db.query(Category).filter(
-            Category.id.in_(request.category_ids)
-        ).all()
-        
-        context["selected_categories"] = [
-            {
-                "id": cat.id,
-                "name": cat.name,
-                "element_count": cat.element_count
-            }
-            for cat in categories
-        ]
-        
-        # Get acts for selected categories
-        acts_in_categories = db.query(LegalAct).join(
-            ActCategory
-        ).filter(
-            ActCategory.category_id.in_(request.category_ids)
-        ).limit(50).all()  # Increased from 10 to 50
-        
-        context["acts_in_categories"] = [
-            {
-                "nreg": act.nreg,
-                "title": act.title,
-                "is_processed": act.is_processed
+
+
+async def get_categories_with_acts(category_ids: List[int], db: AsyncSession, limit: int = 50):
+    """Get selected categories and their acts in one query"""
+    # Number acts within each category so the per-category cap is applied in SQL
+    ranked_acts = select(
+        ActCategory.category_id,
+        LegalAct.nreg,
+        LegalAct.title,
+        LegalAct.is_processed,
+        func.row_number().over(
+            partition_by=ActCategory.category_id, order_by=LegalAct.id
+        ).label("rn")
+    ).join(
+        LegalAct, LegalAct.id == ActCategory.act_id
+    ).where(
+        ActCategory.category_id.in_(category_ids)
+    ).subquery()
+
+    rows = await db.execute(
+        select(
+            Category.id,
+            Category.name,
+            Category.element_count,
+            ranked_acts.c.nreg,
+            ranked_acts.c.title,
+            ranked_acts.c.is_processed
+        ).outerjoin(
+            ranked_acts,
+            and_(ranked_acts.c.category_id == Category.id, ranked_acts.c.rn <= limit)
+        ).where(
+            Category.id.in_(category_ids)
+        ).order_by(Category.id, ranked_acts.c.rn)
+    )
+
+    categories = {}
+    acts = []
+    for row in rows:
+        if row.id not in categories:
+            categories[row.id] = {
+                "id": row.id,
+                "name": row.name,
+                "element_count": row.element_count
             }
-            for act in acts_in_categories
-        ]
-        
-        # Get relations between categories if multiple selected
-        if len(request.category_ids) >= 2:
-            try:
-                relations = neo4j_service.get_relations_between_categories(
-                    request.category_ids[0],
-                    request.category_ids[1]
-                )
-                context["relations"] = relations[:10] if relations else []
-            except:
-                context["relations"] = []
-        
-        # Get statistics
-        try:
-            stats = neo4j_service.get_category_statistics()
-            context["statistics"] = [
-                s for s in stats if s.get("id") in request.category_ids
-            ] if stats else []
-        except:
-            context["statistics"] = []
-    
-    # Always include extracted elements from relevant acts if available
-    # This helps answer questions about content of legal acts
-    for act_data in relevant_acts:
-        if act_data.get("is_processed") and act_data.get("extracted_elements"):
-            # Elements already included in search_relevant_acts result
-            pass
-    
-    # Get additional processed acts with extracted elements for general questions
-    # This ensures we have context even if search didn't find exact matches
-    # Always include processed acts (not just when relevant_acts is empty)
-    processed_acts = db.query(LegalAct).filter(
-        LegalAct.is_processed == True,
-        LegalAct.extracted_elements.isnot(None)
-    ).limit(50).all()  # Increased from 10 to 50
-    
-    context["processed_acts_with_elements"] = []
-    for act in processed_acts:
+        if row.nreg is not None and len(acts) < limit:
+            acts.append({
+                "nreg": row.nreg,
+                "title": row.title,
+                "is_processed": row.is_processed
+            })
+    return list(categories.values()), acts
+
+
+def has_json_value(column):
+    """SQL expression: JSON column holds a non-empty value (not NULL, null, [] or {})"""
+    return func.coalesce(cast(column, String), "null").notin_(["null", "[]", "{}"])
+
+
+async def get_processed_acts_with_elements(db: AsyncSession, limit: int = 50) -> List[Dict[str, Any]]:
+    """Get processed acts with their extracted elements"""
+    # Relations are only reported as a flag - check them in SQL instead of loading the JSON
+    rows = await db.execute(
+        select(
+            LegalAct.nreg,
+            LegalAct.title,
+            LegalAct.extracted_elements,
+            has_json_value(LegalAct.extracted_relations).label("has_relations")
+        ).where(
+            LegalAct.is_processed == True,
+            LegalAct.extracted_elements.isnot(None)
+        ).limit(limit)
+    )
+
+    result = []
+    for act in rows:
         act_info = {
             "nreg": act.nreg,
             "title": act.title,
             "has_elements": bool(act.extracted_elements),
-            "has_relations": bool(act.extracted_relations)
+            "has_relations": bool(act.has_relations)
         }
         # Include extracted elements for better context
         if act.extracted_elements:
@@ -327,19 +392,219 @@ async def chat(
                     act_info["extracted_elements"] = act.extracted_elements
             else:
                 act_info["extracted_elements"] = act.extracted_elements
-        context["processed_acts_with_elements"].append(act_info)
-    
-    # Get answer from OpenAI with full context
-    answer = await openai_service.chat_about_database(
-        request.question,
-        context,
-        conversation_history=request.conversation_history or []
+        result.append(act_info)
+    return result
+
+
+async def get_graph_relations(category_ids: List[int]) -> List[Dict[str, Any]]:
+    """Get relations between the first two selected categories"""
+    if len(category_ids) < 2:
+        return []
+    # Neo4j driver is synchronous - keep it off the event loop
+    return await asyncio.to_thread(
+        neo4j_service.get_relations_between_categories, category_ids[0], category_ids[1], 10
+    )
+
+
+async def get_graph_context(category_ids: List[int]) -> Dict[str, Any]:
+    """Get relations and statistics for selected categories from Neo4j"""
+    try:
+        # Statistics come from the shared cache and are filtered here - the whole-graph
+        # aggregation stays off the chat path
+        statistics, relations = await asyncio.gather(
+            neo4j_service.get_category_statistics_cached(),
+            get_graph_relations(category_ids)
+        )
+        selected_ids = set(category_ids)
+        return {
+            "relations": relations,
+            "statistics": [s for s in statistics if s["id"] in selected_ids]
+        }
+    except Exception:
+        return {"relations": [], "statistics": []}
+
+
+def chat_cache_key(request: ChatRequest) -> str:
+    """Cache key for a chat request (question, selected categories and history)"""
+    payload = json.dumps(
+        [request.question, sorted(request.category_ids or []), request.conversation_history or []],
+        ensure_ascii=False
+    )
+    return "chat:" + hashlib.blake2b(payload.encode(), digest_size=16).hexdigest()
+
+
+async def with_session(builder):
+    """Run a context builder on its own session (sessions can't be shared between concurrent tasks)"""
+    async with AsyncSessionLocal() as db:
+        return await builder(db)
+
+
+async def _empty_pair():
+    return [], []
+
+
+async def _empty_graph_context() -> Dict[str, Any]:
+    return {"relations": [], "statistics": []}
+
+
+async def get_existing_category_ids(category_ids: List[int], db: AsyncSession) -> List[int]:
+    """Drop unknown category IDs, keeping the requested order (relations use the first two)"""
+    found_ids = set(await db.scalars(select(Category.id).where(Category.id.in_(category_ids))))
+    return [category_id for category_id in dict.fromkeys(category_ids) if category_id in found_ids]
+
+
+async def build_chat_context(request: ChatRequest) -> Dict[str, Any]:
+    """Collect database and graph context for a chat question"""
+    category_ids = request.category_ids or []
+    if category_ids:
+        # Validate IDs up front (primary key lookup) - unknown categories would only
+        # cost category and Neo4j queries that return nothing
+        category_ids = await with_session(lambda db: get_existing_category_ids(category_ids, db))
+        if len(category_ids) < len(request.category_ids):
+            logger.info(f"Ignoring unknown category IDs: {set(request.category_ids) - set(category_ids)}")
+
+    # Context builders are independent - run them concurrently
+    (
+        database_statistics,
+        relevant_acts,
+        relevant_categories,
+        all_acts_in_database,
+        (selected_categories, acts_in_categories),
+        graph_context,
+        processed_acts_with_elements
+    ) = await asyncio.gather(
+        with_session(get_database_statistics),
+        with_session(lambda db: search_relevant_acts(request.question, db, limit=10)),  # Increased from 5 to 10
+        with_session(lambda db: search_relevant_categories(request.question, db)),
+        # ALWAYS include list of all acts in database (for general questions)
+        # This ensures chat has access to all loaded acts, not just search results
+        with_session(get_all_acts_overview),
+        with_session(lambda db: get_categories_with_acts(category_ids, db)) if category_ids else _empty_pair(),
+        get_graph_context(category_ids) if category_ids else _empty_graph_context(),
+        # Get additional processed acts with extracted elements for general questions
+        # This ensures we have context even if search didn't find exact matches
+        with_session(get_processed_acts_with_elements)
     )
+
+    # Build context from database
+    context = {
+        "database_statistics": database_statistics,
+        "relevant_acts": relevant_acts,
+        "relevant_categories": relevant_categories,
+        "all_acts_in_database": all_acts_in_database
+    }
+    logger.info(f"Added {len(all_acts_in_database)} acts to context (total in DB: {database_statistics.get('total_acts', 0)})")
+
+    # If specific categories requested, include their info
+    if category_ids:
+        context["selected_categories"] = selected_categories
+        context["acts_in_categories"] = acts_in_categories
+        # Relations only make sense if multiple categories selected
+        if len(category_ids) >= 2:
+            context["relations"] = graph_context["relations"]
+        context["statistics"] = graph_context["statistics"]
+
+    context["processed_acts_with_elements"] = processed_acts_with_elements
+    return context
+
+
+@router.post("/", response_model=ChatResponse)
+async def chat(request: ChatRequest):
+    """Chat about legal acts, categories, and relations using database data"""
+    # Repeated questions skip both the database and the OpenAI round trip
+    cache_key = chat_cache_key(request)
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        logger.info(f"Chat cache hit: {cache_key}")
+        # Stored from ChatResponse.model_dump() - already valid, skip re-validating it
+        return ORJSONResponse(cached)
+
+    context = await build_chat_context(request)
+
+    # Get answer from OpenAI with full context
+    try:
+        answer = await openai_service.chat_about_database(
+            request.question,
+            context,
+            conversation_history=request.conversation_history or []
+        )
+        failed = False
+    except RuntimeError as e:
+        # Misconfiguration (no API key) - not something the apology text should hide
+        logger.error(f"Chat is unavailable: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+    except Exception as e:
+        # Transient upstream errors must not be cached as the answer to this question
+        logger.error(f"Error answering chat question: {e}")
+        answer = CHAT_ERROR_MESSAGE
+        failed = True
     
-    return ChatResponse(
+    response = ChatResponse(
         answer=answer,
         context_used=context,
-        relevant_acts=relevant_acts,
-        relevant_categories=relevant_categories
+        relevant_acts=context["relevant_acts"],
+        relevant_categories=context["relevant_categories"]
     )
+    if not failed:
+        await cache_set(cache_key, response.model_dump(), settings.CHAT_CACHE_TTL)
+    return response
+
+
+def sse_event(data: Any, event: Optional[str] = None) -> bytes:
+    """Format a Server-Sent Events frame"""
+    frame = f"event: {event}\n" if event else ""
+    return (frame + "data: ").encode() + orjson.dumps(data) + b"\n\n"
+
 
+@router.post("/stream")
+async def chat_stream(request: ChatRequest):
+    """Same as POST /chat/, but streams the answer as Server-Sent Events
+
+    Frames: `data: {"delta": "..."}` for each answer chunk, then a final
+    `event: context` frame with context_used / relevant_acts / relevant_categories.
+    If the answer fails, an `event: error` frame is sent instead of the context frame.
+    """
+    cache_key = chat_cache_key(request)
+
+    async def events():
+        cached = await cache_get(cache_key)
+        if cached is not None:
+            logger.info(f"Chat cache hit: {cache_key}")
+            yield sse_event({"delta": cached["answer"]})
+            yield sse_event({k: v for k, v in cached.items() if k != "answer"}, event="context")
+            return
+
+        context = await build_chat_context(request)
+
+        # Forward answer chunks as soon as OpenAI produces them
+        chunks = []
+        try:
+            async for delta in openai_service.chat_about_database_stream(
+                request.question,
+                context,
+                conversation_history=request.conversation_history or []
+            ):
+                chunks.append(delta)
+                yield sse_event({"delta": delta})
+        except RuntimeError as e:
+            yield sse_event({"error": str(e)}, event="error")
+            return
+        except Exception:
+            # Upstream failure mid-answer - report it and don't cache the partial answer
+            yield sse_event({"error": CHAT_ERROR_MESSAGE}, event="error")
+            return
+
+        response = ChatResponse(
+            answer="".join(chunks),
+            context_used=context,
+            relevant_acts=context["relevant_acts"],
+            relevant_categories=context["relevant_categories"]
+        )
+        yield sse_event(response.model_dump(exclude={"answer"}), event="context")
+        await cache_set(cache_key, response.model_dump(), settings.CHAT_CACHE_TTL)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
@@ -8,29 +8,29 @@ from app.core.config import settings
 router = APIRouter()
 
 
+# Environment doesn't change while the process runs - build the snapshot once
+_db_url_env = os.getenv("DATABASE_URL", "NOT_SET")
+_db_url_settings = settings.DATABASE_URL
+
+_ENV_SNAPSHOT = {
+    "DATABASE_URL_from_env": _db_url_env[:100] + "..." if len(_db_url_env) > 100 else _db_url_env,
+    "DATABASE_URL_from_settings": str(_db_url_settings)[:100] + "..." if _db_url_settings and len(str(_db_url_settings)) > 100 else str(_db_url_settings),
+    # Check if it's a Railway Reference
+    "is_reference": _db_url_env.startswith("${{") if _db_url_env else False,
+    "env_length": len(_db_url_env) if _db_url_env else 0,
+    "settings_is_none": _db_url_settings is None,
+    "all_env_vars_with_db": {
+        k: (v[:50] + "..." if len(v) > 50 else v)
+        for k, v in os.environ.items()
+        if "DATABASE" in k or "POSTGRES" in k
+    }
+}
+
+
 @router.get("/env")
 async def debug_env():
     """
     Debug endpoint to see what environment variables are available
-    WARNING: This exposes sensitive information - remove in production!
+    WARNING: This exposes sensitive information - only registered with DEBUG=true
     """
-    # Get DATABASE_URL from environment directly
-    db_url_env = os.getenv("DATABASE_URL", "NOT_SET")
-    db_url_settings = settings.DATABASE_URL
-    
-    # Check if it's a Railway Reference
-    is_reference = db_url_env.startswith("${{") if db_url_env else False
-    
-    return {
-        "DATABASE_URL_from_env": db_url_env[:100] + "..." if len(db_url_env) > 100 else db_url_env,
-        "DATABASE_URL_from_settings": str(db_url_settings)[:100] + "..." if db_url_settings and len(str(db_url_settings)) > 100 else str(db_url_settings),
-        "is_reference": is_reference,
-        "env_length": len(db_url_env) if db_url_env else 0,
-        "settings_is_none": db_url_settings is None,
-        "all_env_vars_with_db": {
-            k: (v[:50] + "..." if len(v) > 50 else v) 
-            for k, v in os.environ.items() 
-            if "DATABASE" in k or "POSTGRES" in k
-        }
-    }
-
+    return _ENV_SNAPSHOT
@@ -4,7 +4,10 @@ API endpoints for graph operations
 from fastapi import APIRouter, Depends, HTTPException, Query
 from typing import List
 from app.services.neo4j_service import neo4j_service
-from pydantic import BaseModel
+from app.core.cache import cache_get, cache_set_relations, relations_cache_key
+from app.core.config import settings
+from pydantic import BaseModel, TypeAdapter
+import asyncio
 
 router = APIRouter()
 
@@ -27,6 +30,11 @@ class GraphResponse(BaseModel):
     edges: List[GraphEdge]
 
 
+# Built once - validates a whole list in one pydantic-core call
+_NODES_ADAPTER = TypeAdapter(List[GraphNode])
+_EDGES_ADAPTER = TypeAdapter(List[GraphEdge])
+
+
 @router.get("/categories", response_model=GraphResponse)
 async def get_category_graph(
     category_ids: List[int] = Query(..., description="List of category IDs"),
@@ -36,11 +44,12 @@ async def get_category_graph(
     if not category_ids:
         raise HTTPException(status_code=400, detail="At least one category ID required")
     
-    graph_data = neo4j_service.get_category_graph(category_ids, depth)
+    # Neo4j driver is synchronous - keep it off the event loop
+    graph_data = await asyncio.to_thread(neo4j_service.get_category_graph, category_ids, depth)
     
     return GraphResponse(
-        nodes=[GraphNode(**node) for node in graph_data["nodes"]],
-        edges=[GraphEdge(**edge) for edge in graph_data["edges"]]
+        nodes=_NODES_ADAPTER.validate_python(graph_data["nodes"]),
+        edges=_EDGES_ADAPTER.validate_python(graph_data["edges"])
     )
 
 
@@ -50,10 +59,16 @@ async def get_relations_between_categories(
     category2_id: int = Query(..., description="Second category ID")
 ):
     """Get relations between two categories"""
-    relations = neo4j_service.get_relations_between_categories(
-        category1_id,
-        category2_id
-    )
+    # Category pairs are a small key space - serve repeated pairs from Redis
+    cache_key = relations_cache_key(category1_id, category2_id)
+    relations = await cache_get(cache_key)
+    if relations is None:
+        relations = await asyncio.to_thread(
+            neo4j_service.get_relations_between_categories,
+            category1_id,
+            category2_id
+        )
+        await cache_set_relations(category1_id, category2_id, relations, settings.RELATIONS_CACHE_TTL)
     
     return {
         "category1_id": category1_id,
@@ -66,6 +81,6 @@ async def get_relations_between_categories(
 @router.get("/statistics")
 async def get_graph_statistics():
     """Get statistics for all categories in graph"""
-    stats = neo4j_service.get_category_statistics()
+    stats = await neo4j_service.get_category_statistics_cached()
     return {"statistics": stats}
 
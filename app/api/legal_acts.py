@@ -1,21 +1,102 @@
 """
 API endpoints for legal acts
 """
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Path, Query, Body
+from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks, Path, Query, Body, Request
+from fastapi.responses import ORJSONResponse
+from sqlalchemy import JSON, bindparam, case, func, literal_column, select, type_coerce
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
+from datetime import datetime
 from urllib.parse import unquote
-from app.core.database import get_db
-from app.models.legal_act import LegalAct
+from app.core.cache import act_cache_key, act_check_cache_key, act_details_cache_key, cache_get, cache_set
+from app.core.config import settings
+from app.core.database import get_db, get_async_db, is_postgres
+from app.models.legal_act import LegalAct, ActCategory
 from app.models.category import Category
 from app.services.processing_service import ProcessingService
-from pydantic import BaseModel
+from app.services.rada_api import rada_api
+from app.services.neo4j_service import neo4j_service
+from app.services import jobs
+from app.core.queue import enqueue_job
+from pydantic import BaseModel, ConfigDict
+from cachetools import TTLCache
 import logging
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Statement objects for NREG lookups - SQLAlchemy compiles each once and
+# asyncpg reuses the server-side prepared statement.
+# /check only needs two columns - no ORM object per lookup
+_ACT_STATUS_BY_NREG = select(LegalAct.is_processed, LegalAct.title).where(
+    LegalAct.nreg == bindparam("nreg")
+).limit(1)
+# GET /{nreg} returns just the list columns - no ORM object or Pydantic model per request
+_ACT_SUMMARY_BY_NREG = select(
+    LegalAct.id,
+    LegalAct.nreg,
+    LegalAct.title,
+    LegalAct.is_processed,
+    LegalAct.document_type,
+    LegalAct.status,
+    LegalAct.date_acceptance,
+    LegalAct.date_publication
+).where(LegalAct.nreg == bindparam("nreg")).limit(1)
+# available-acts enriches a page of Rada API results with their database status
+_ACT_LIST_STATUS_BY_NREGS = select(
+    LegalAct.nreg,
+    LegalAct.is_processed,
+    LegalAct.document_type,
+    LegalAct.date_acceptance,
+    LegalAct.date_publication
+).where(LegalAct.nreg.in_(bindparam("nregs", expanding=True)))
+# /details gets the act's categories as one JSON array built by the database -
+# no ORM objects or per-category dicts in Python. Keys are inlined literals:
+# json_build_object can't infer types for bound parameters
+_category_fields = (
+    literal_column("'id'"), Category.id,
+    literal_column("'name'"), Category.name,
+    literal_column("'confidence'"), ActCategory.confidence
+)
+if is_postgres:
+    _categories_json = func.coalesce(
+        func.json_agg(func.json_build_object(*_category_fields)),
+        literal_column("'[]'::json")
+    )
+else:
+    _categories_json = func.json_group_array(func.json_object(*_category_fields))
+_ACT_DETAILS_BY_NREG = select(
+    LegalAct.id,
+    LegalAct.nreg,
+    LegalAct.title,
+    LegalAct.is_processed,
+    LegalAct.processed_at,
+    LegalAct.document_type,
+    LegalAct.status,
+    LegalAct.date_acceptance,
+    LegalAct.date_publication,
+    LegalAct.extracted_elements,
+    LegalAct.extracted_relations,
+    type_coerce(
+        select(_categories_json)
+        .join_from(ActCategory, Category, ActCategory.category_id == Category.id)
+        .where(ActCategory.act_id == LegalAct.id)
+        .scalar_subquery(),
+        JSON
+    ).label("categories")
+).where(LegalAct.nreg == bindparam("nreg")).limit(1)
+# Alternative NREGs from a Rada card are probed together in one IN query
+_ACT_STATUS_BY_NREGS = select(LegalAct.nreg, LegalAct.is_processed, LegalAct.title).where(
+    LegalAct.nreg.in_(bindparam("nregs", expanding=True))
+)
+
+# Rada document cards found for /check - existence on the Rada website changes rarely,
+# and every uncached lookup waits for the API's 5-7 s rate limit pause
+RADA_CARD_CACHE_TTL = 600  # seconds
+_rada_card_cache = TTLCache(maxsize=4096, ttl=RADA_CARD_CACHE_TTL)
+
 
 class LegalActResponse(BaseModel):
     id: int
@@ -24,11 +105,10 @@ class LegalActResponse(BaseModel):
     is_processed: bool
     document_type: Optional[str] = None
     status: Optional[str] = None
-    date_acceptance: Optional[str] = None
-    date_publication: Optional[str] = None
+    date_acceptance: Optional[datetime] = None
+    date_publication: Optional[datetime] = None
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class LegalActDetailResponse(BaseModel):
@@ -36,120 +116,60 @@ class LegalActDetailResponse(BaseModel):
     nreg: str
     title: str
     is_processed: bool
-    processed_at: Optional[str] = None
+    processed_at: Optional[datetime] = None
     document_type: Optional[str] = None
     status: Optional[str] = None
-    date_acceptance: Optional[str] = None
-    date_publication: Optional[str] = None
+    date_acceptance: Optional[datetime] = None
+    date_publication: Optional[datetime] = None
     extracted_elements: Optional[dict] = None
     extracted_relations: Optional[dict] = None
     categories: List[dict] = []
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 @router.get("/", response_model=List[LegalActResponse])
 async def get_legal_acts(
-    db: Session = Depends(get_db)
+    request: Request,
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of acts to return"),
+    after_id: Optional[int] = Query(None, description="Return acts after this id (last id of the previous page)"),
+    processed: Optional[bool] = Query(None, description="Filter by processing status"),
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """Get all legal acts"""
+    """Get legal acts, newest first (keyset pagination by id)"""
     try:
-        # Ensure tables exist
-        from app.core.database import Base, engine
-        Base.metadata.create_all(bind=engine)
-        
-        # Try to add new columns if they don't exist (for existing databases)
-        try:
-            from sqlalchemy import inspect, text
-            inspector = inspect(engine)
-            columns = [col['name'] for col in inspector.get_columns('legal_acts')]
-            
-            # Add dataset_id if missing
-            if 'dataset_id' not in columns:
-                logger.warning("Column 'dataset_id' not found in legal_acts table, adding it...")
-                with engine.connect() as conn:
-                    conn.execute(text("ALTER TABLE legal_acts ADD COLUMN dataset_id VARCHAR(100)"))
-                    conn.execute(text("CREATE INDEX IF NOT EXISTS ix_legal_acts_dataset_id ON legal_acts(dataset_id)"))
-                    conn.commit()
-                logger.info("Column 'dataset_id' added successfully")
-            
-            # Add dataset_metadata if missing
-            if 'dataset_metadata' not in columns:
-                logger.warning("Column 'dataset_metadata' not found in legal_acts table, adding it...")
-                with engine.connect() as conn:
-                    conn.execute(text("ALTER TABLE legal_acts ADD COLUMN dataset_metadata JSON"))
-                    conn.commit()
-                logger.info("Column 'dataset_metadata' added successfully")
-            
-            # Add source if missing
-            if 'source' not in columns:
-                logger.warning("Column 'source' not found in legal_acts table, adding it...")
-                with engine.connect() as conn:
-                    conn.execute(text("ALTER TABLE legal_acts ADD COLUMN source VARCHAR(50) DEFAULT 'rada_api'"))
-                    conn.commit()
-                logger.info("Column 'source' added successfully")
-        except Exception as migration_error:
-            # Column might already exist or migration failed, continue
-            logger.debug(f"Migration check: {migration_error}")
-        
-        # Get acts from database
-        # First ensure migration is complete by checking if new columns exist
-        try:
-            from sqlalchemy import inspect, text
-            inspector = inspect(engine)
-            columns = [col['name'] for col in inspector.get_columns('legal_acts')]
-            
-            # If new columns don't exist, use explicit column selection to avoid errors
-            if 'dataset_id' not in columns or 'dataset_metadata' not in columns or 'source' not in columns:
-                # Use explicit column selection without new fields
-                from sqlalchemy import select, column
-                acts = db.execute(
-                    select(
-                        LegalAct.id,
-                        LegalAct.nreg,
-                        LegalAct.title,
-                        LegalAct.is_processed,
-                        LegalAct.document_type,
-                        LegalAct.status,
-                        LegalAct.date_acceptance,
-                        LegalAct.date_publication
-                    ).order_by(LegalAct.created_at.desc()).limit(100)
-                ).all()
-                # Convert to LegalAct-like objects
-                result = []
-                for row in acts:
-                    result.append(LegalActResponse(
-                        id=row.id,
-                        nreg=row.nreg,
-                        title=row.title,
-                        is_processed=row.is_processed,
-                        document_type=row.document_type,
-                        status=row.status,
-                        date_acceptance=row.date_acceptance.isoformat() if row.date_acceptance else None,
-                        date_publication=row.date_publication.isoformat() if row.date_publication else None
-                    ))
-                return result
-        except Exception as migration_check_error:
-            logger.debug(f"Migration check failed: {migration_check_error}, using standard query")
-        
-        # Standard query if migration is complete
-        acts = db.query(LegalAct).order_by(LegalAct.created_at.desc()).limit(100).all()
+        # New columns (dataset_id, dataset_metadata, source) are migrated on startup,
+        # see app/core/migrations.py
+        query = select(
+            LegalAct.id,
+            LegalAct.nreg,
+            LegalAct.title,
+            LegalAct.is_processed,
+            LegalAct.document_type,
+            LegalAct.status,
+            LegalAct.date_acceptance,
+            LegalAct.date_publication
+        )
+        # Keyset instead of OFFSET - every page is a primary key index seek
+        if after_id is not None:
+            query = query.where(LegalAct.id < after_id)
+        if processed is not None:
+            query = query.where(LegalAct.is_processed == processed)
+        # Server-side cursor - rows arrive in batches instead of one buffered result set
+        acts = await db.stream(
+            query.order_by(LegalAct.id.desc()).limit(limit).execution_options(yield_per=200)
+        )
         
-        # Convert to response format with proper date formatting
-        result = []
-        for act in acts:
-            result.append(LegalActResponse(
-                id=act.id,
-                nreg=act.nreg,
-                title=act.title,
-                is_processed=act.is_processed,
-                document_type=act.document_type,
-                status=act.status,
-                date_acceptance=act.date_acceptance.isoformat() if act.date_acceptance else None,
-                date_publication=act.date_publication.isoformat() if act.date_publication else None
-            ))
-        return result
+        # Core rows as mappings already have the response shape - orjson serializes them
+        # (and the dates) directly, without building a Pydantic model per act
+        result = [dict(act) async for act in acts.mappings()]
+
+        # Full page - point the client at the next one (RFC 8288 Link header)
+        headers = {}
+        if len(result) == limit:
+            next_url = request.url.include_query_params(after_id=result[-1]["id"])
+            headers["Link"] = f'<{next_url}>; rel="next"'
+        return ORJSONResponse(result, headers=headers)
     except Exception as e:
         logger.error(f"Error getting legal acts: {e}", exc_info=True)
         raise HTTPException(
@@ -158,18 +178,11 @@ async def get_legal_acts(
         )
 
 
-
-
 @router.get("/test-open-data-api")
-async def test_open_data_api(db: Session = Depends(get_db)):
+async def test_open_data_api():
     """
     Test open data portal API - find and fetch legal acts dataset
     """
-    from app.services.rada_api import rada_api
-    import logging
-    
-    logger = logging.getLogger(__name__)
-    
     try:
         # Try to find dataset ID
         logger.info("Searching for legal acts dataset ID...")
@@ -209,14 +222,10 @@ async def test_open_data_api(db: Session = Depends(get_db)):
 async def initialize_categories(db: Session = Depends(get_db)):
     """Initialize categories in database"""
     try:
-        # Ensure tables exist first
-        from app.core.database import Base, engine
-        Base.metadata.create_all(bind=engine)
-        
+        # Tables are created on startup; initialize_categories returns the total count
         processing_service = ProcessingService(db)
-        await processing_service.initialize_categories()
+        count = await processing_service.initialize_categories()
         
-        count = db.query(Category).count()
         return {
             "message": f"Categories initialized successfully. Total categories: {count}",
             "count": count
@@ -232,17 +241,11 @@ async def initialize_categories(db: Session = Depends(get_db)):
 @router.post("/import-categories")
 async def import_categories(
     categories: List[Dict[str, Any]] = Body(..., description="List of categories with format: [{'code': int, 'name': str}]"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Import categories from list
     """
-    from app.models.category import Category
-    from app.services.neo4j_service import neo4j_service
-    import logging
-    
-    logger = logging.getLogger(__name__)
-    
     try:
         created = 0
         updated = 0
@@ -255,7 +258,7 @@ async def import_categories(
                 continue
             
             # Check if category exists by name
-            existing = db.query(Category).filter(Category.name == name).first()
+            existing = await db.scalar(select(Category).where(Category.name == name).limit(1))
             
             if existing:
                 # Update existing category
@@ -279,7 +282,7 @@ async def import_categories(
                 except Exception as e:
                     logger.warning(f"Failed to create category in Neo4j: {e}")
         
-        db.commit()
+        await db.commit()
         
         return {
             "message": f"Categories imported successfully. Created: {created}, Updated: {updated}",
@@ -288,182 +291,37 @@ async def import_categories(
         }
     except Exception as e:
         logger.error(f"Error importing categories: {e}", exc_info=True)
-        db.rollback()
+        await db.rollback()
         raise HTTPException(
             status_code=500,
             detail=f"Error importing categories: {str(e)}"
         )
 
 
-@router.get("/{nreg:path}/check")
-async def check_legal_act_exists(
-    nreg: str = Path(..., description="Номер реєстрації акту"),
-    db: Session = Depends(get_db)
-):
-    """
-    Check if legal act exists on Rada website and in database
-    """
-    from app.services.rada_api import rada_api
-    import logging
-    
-    logger = logging.getLogger(__name__)
-    
-    # Decode URL-encoded characters
-    nreg = unquote(nreg)
-    
-    try:
-        # Check in database first
-        act = db.query(LegalAct).filter(LegalAct.nreg == nreg).first()
-        
-        if act:
-            return {
-                "exists": True,
-                "in_database": True,
-                "is_processed": act.is_processed,
-                "title": act.title,
-                "message": f"Act {nreg} exists in database"
-            }
-        
-        # Check on Rada website
-        try:
-            card_json = await rada_api.get_document_card(nreg)
-            
-            if card_json:
-                # Try to get alternative NREG formats
-                alternative_nregs = []
-                if card_json.get("nreg"):
-                    alternative_nregs.append(card_json.get("nreg"))
-                if card_json.get("number"):
-                    alternative_nregs.append(card_json.get("number"))
-                if card_json.get("id"):
-                    alternative_nregs.append(card_json.get("id"))
-                
-                # Check if any alternative exists in DB
-                for alt_nreg in alternative_nregs:
-                    if alt_nreg:
-                        alt_act = db.query(LegalAct).filter(LegalAct.nreg == alt_nreg).first()
-                        if alt_act:
-                            return {
-                                "exists": True,
-                                "in_database": True,
-                                "is_processed": alt_act.is_processed,
-                                "title": alt_act.title,
-                                "message": f"Act found with alternative NREG: {alt_nreg}"
-                            }
-                
-                return {
-                    "exists": True,
-                    "in_database": False,
-                    "is_processed": False,
-                    "title": card_json.get("title", nreg),
-                    "message": f"Act {nreg} exists on Rada website but not in database"
-                }
-        except Exception as e:
-            logger.debug(f"Error checking act on Rada: {e}")
-        
-        return {
-            "exists": False,
-            "in_database": False,
-            "is_processed": False,
-            "title": None,
-            "message": f"Act {nreg} not found"
-        }
-    except Exception as e:
-        logger.error(f"Error checking act {nreg}: {e}", exc_info=True)
-        return {
-            "exists": False,
-            "in_database": False,
-            "is_processed": False,
-            "title": None,
-            "message": f"Помилка при перевірці акту: {str(e)}"
-        }
-
-
-@router.get("/{nreg:path}/details", response_model=LegalActDetailResponse)
-async def get_legal_act_details(
-    nreg: str = Path(..., description="Номер реєстрації акту"),
-    db: Session = Depends(get_db)
-):
-    """Get detailed information about processed legal act including extracted elements"""
-    # Decode URL-encoded characters
-    nreg = unquote(nreg)
-    act = db.query(LegalAct).filter(LegalAct.nreg == nreg).first()
-    if not act:
-        raise HTTPException(status_code=404, detail="Legal act not found")
-    
-    # Get categories
-    categories = []
-    for act_cat in act.categories:
-        categories.append({
-            "id": act_cat.category.id,
-            "name": act_cat.category.name,
-            "confidence": act_cat.confidence
-        })
-    
-    return LegalActDetailResponse(
-        id=act.id,
-        nreg=act.nreg,
-        title=act.title,
-        is_processed=act.is_processed,
-        processed_at=act.processed_at.isoformat() if act.processed_at else None,
-        document_type=act.document_type,
-        status=act.status,
-        date_acceptance=act.date_acceptance.isoformat() if act.date_acceptance else None,
-        date_publication=act.date_publication.isoformat() if act.date_publication else None,
-        extracted_elements=act.extracted_elements,
-        extracted_relations=act.extracted_relations,
-        categories=categories
-    )
-
-
 @router.get("/rada-list")
 async def get_rada_acts_list(
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Отримати список всіх НПА з бази даних
     Повертає список документів з інформацією про те, які вже завантажені та оброблені
     Більше не витягує NREG з API - використовує тільки дані з БД
     """
-    import logging
-    
-    logger = logging.getLogger(__name__)
-    
     try:
-        # Ensure migration is complete before querying
-        from app.core.database import Base, engine
-        Base.metadata.create_all(bind=engine)
-        
-        # Try to add new columns if they don't exist
-        try:
-            from sqlalchemy import inspect, text
-            inspector = inspect(engine)
-            columns = [col['name'] for col in inspector.get_columns('legal_acts')]
-            
-            if 'dataset_id' not in columns:
-                with engine.connect() as conn:
-                    conn.execute(text("ALTER TABLE legal_acts ADD COLUMN IF NOT EXISTS dataset_id VARCHAR(100)"))
-                    conn.execute(text("CREATE INDEX IF NOT EXISTS ix_legal_acts_dataset_id ON legal_acts(dataset_id)"))
-                    conn.commit()
-            
-            if 'dataset_metadata' not in columns:
-                with engine.connect() as conn:
-                    conn.execute(text("ALTER TABLE legal_acts ADD COLUMN IF NOT EXISTS dataset_metadata JSON"))
-                    conn.commit()
-            
-            if 'source' not in columns:
-                with engine.connect() as conn:
-                    conn.execute(text("ALTER TABLE legal_acts ADD COLUMN IF NOT EXISTS source VARCHAR(50) DEFAULT 'rada_api'"))
-                    conn.commit()
-        except Exception as migration_error:
-            logger.debug(f"Migration check: {migration_error}")
-        
-        # Get all acts from database (no API calls for NREG extraction)
-        all_acts = db.query(LegalAct).order_by(LegalAct.created_at.desc()).all()
+        # New columns (dataset_id, dataset_metadata, source) are migrated on startup,
+        # see app/core/migrations.py
+        # Counts are aggregated in SQL - only the requested page is loaded (no API calls for NREG extraction)
+        totals = (await db.execute(
+            select(
+                func.count(LegalAct.id),
+                func.coalesce(func.sum(case((LegalAct.is_processed == True, 1), else_=0)), 0)
+            )
+        )).one()
+        total_count, processed_count = totals[0], totals[1]
         
-        if not all_acts:
+        if not total_count:
             return {
                 "total": 0,
                 "loaded": 0,
@@ -476,32 +334,36 @@ async def get_rada_acts_list(
                 "message": "Список НПА порожній. Натисніть 'Завантажити з датасету' або 'Завантажити всі НПА' для отримання переліку."
             }
         
+        page = await db.execute(
+            select(
+                LegalAct.nreg,
+                LegalAct.title,
+                LegalAct.is_processed,
+                LegalAct.source,
+                LegalAct.dataset_id
+            ).order_by(LegalAct.created_at.desc()).offset(skip).limit(limit)
+        )
+        
         # Build response with status for each act
-        acts_list = []
-        for act in all_acts:
-            acts_list.append({
+        paginated_acts = [
+            {
                 "nreg": act.nreg,
                 "title": act.title if act.title else act.nreg,
                 "in_database": True,  # All acts in DB are loaded
-                "is_processed": act.is_processed if act.is_processed else False,
+                "is_processed": bool(act.is_processed),
                 "status": "processed" if act.is_processed else "loaded",
                 "status_label": "✅ Оброблено" if act.is_processed else "📥 Завантажено",
-                "source": getattr(act, 'source', 'rada_api'),
-                "dataset_id": getattr(act, 'dataset_id', None)
-            })
-        
-        loaded_count = len(acts_list)
-        processed_count = len([a for a in acts_list if a["is_processed"]])
-        
-        # Apply pagination
-        total_count = len(acts_list)
-        paginated_acts = acts_list[skip:skip + limit]
+                "source": act.source,
+                "dataset_id": act.dataset_id
+            }
+            for act in page
+        ]
         
         return {
             "total": total_count,
-            "loaded": loaded_count,
+            "loaded": total_count,  # All are in DB
             "processed": processed_count,
-            "not_loaded": 0,  # All are in DB
+            "not_loaded": 0,
             "skip": skip,
             "limit": limit,
             "has_more": skip + limit < total_count,
@@ -520,156 +382,13 @@ async def get_rada_acts_list(
 async def download_all_from_dataset(
     background_tasks: BackgroundTasks,
     dataset_id: Optional[str] = Query(None, description="Dataset ID (e.g., 'docs', 'laws'). If not provided, will auto-detect"),
-    limit: Optional[int] = Query(None, description="Limit number of documents to download"),
-    db: Session = Depends(get_db)
+    limit: Optional[int] = Query(None, description="Limit number of documents to download")
 ):
     """
     Завантажити ВСІ документи з open data датасету без фільтрації по NREG
     Створює записи в БД з усією доступною інформацією з датасету
     """
-    from app.services.rada_api import rada_api
-    from app.core.database import SessionLocal
-    import asyncio
-    import logging
-    from datetime import datetime
-    
-    logger = logging.getLogger(__name__)
-    
-    async def download_all_documents_task():
-        """Background task для завантаження всіх документів з датасету"""
-        bg_db = SessionLocal()
-        try:
-            logger.info(f"Starting download of ALL documents from open data dataset (dataset_id={dataset_id})...")
-            
-            # Get all documents from dataset
-            all_documents = await rada_api.get_all_documents_from_dataset(dataset_id=dataset_id, limit=limit)
-            
-            if not all_documents:
-                logger.error("No documents found in dataset")
-                return
-            
-            logger.info(f"Found {len(all_documents)} documents in dataset")
-            
-            # Get existing NREGs from database
-            existing_nregs = {act.nreg for act in bg_db.query(LegalAct.nreg).all()}
-            
-            # Create or update acts in database
-            created = 0
-            updated = 0
-            skipped = 0
-            
-            for doc in all_documents:
-                try:
-                    # Generate unique identifier for document
-                    # Use NREG if available and valid, otherwise generate unique ID
-                    import hashlib
-                    import json
-                    
-                    # Try to get NREG from document
-                    nreg = (doc.get("nreg") or doc.get("NREG") or None)
-                    
-                    # If NREG is invalid or missing, generate unique ID from document content
-                    if not nreg or not rada_api._is_valid_nreg(str(nreg)):
-                        # Generate unique ID from document metadata
-                        doc_str = json.dumps(doc, sort_keys=True, default=str)
-                        doc_hash = hashlib.md5(doc_str.encode()).hexdigest()[:12]
-                        dataset_prefix = dataset_id or doc.get("_dataset_id") or "dataset"
-                        nreg = f"{dataset_prefix}_{doc_hash}"
-                        logger.debug(f"Generated NREG for document: {nreg}")
-                    
-                    # Extract title
-                    title = (doc.get("title") or doc.get("name") or 
-                            doc.get("Title") or doc.get("Name") or 
-                            doc.get("назва") or doc.get("Назва") or 
-                            f"Документ {nreg}")
-                    
-                    # Extract status
-                    status = (doc.get("status") or doc.get("Status") or 
-                             doc.get("статус") or doc.get("Статус"))
-                    
-                    # Extract dates
-                    date_acceptance = None
-                    date_publication = None
-                    
-                    for date_field in ["date_acceptance", "date_publication", "date", "Date", 
-                                      "дата_прийняття", "дата_опублікування"]:
-                        if date_field in doc and doc[date_field]:
-                            try:
-                                from dateutil import parser
-                                parsed_date = parser.parse(str(doc[date_field]))
-                                if "acceptance" in date_field.lower() or "прийняття" in date_field.lower():
-                                    date_acceptance = parsed_date
-                                elif "publication" in date_field.lower() or "опублікування" in date_field.lower():
-                                    date_publication = parsed_date
-                                elif not date_acceptance:
-                                    date_acceptance = parsed_date
-                            except:
-                                pass
-                    
-                    # Extract document type
-                    document_type = (doc.get("document_type") or doc.get("type") or 
-                                    doc.get("DocumentType") or doc.get("Type"))
-                    
-                    # Check if already exists
-                    act = bg_db.query(LegalAct).filter(LegalAct.nreg == nreg).first()
-                    
-                    if act:
-                        # Update with dataset information
-                        if not act.title or act.title == act.nreg:
-                            act.title = title
-                        if status and not act.status:
-                            act.status = status
-                        if document_type and not act.document_type:
-                            act.document_type = document_type
-                        if date_acceptance and not act.date_acceptance:
-                            act.date_acceptance = date_acceptance
-                        if date_publication and not act.date_publication:
-                            act.date_publication = date_publication
-                        
-                        # Update dataset metadata
-                        act.dataset_id = dataset_id or doc.get("_dataset_id")
-                        act.dataset_metadata = doc
-                        act.source = "open_data"
-                        
-                        updated += 1
-                    else:
-                        # Create new act with all available information
-                        new_act = LegalAct(
-                            nreg=nreg,
-                            title=title,
-                            status=status,
-                            document_type=document_type,
-                            date_acceptance=date_acceptance,
-                            date_publication=date_publication,
-                            dataset_id=dataset_id or doc.get("_dataset_id"),
-                            dataset_metadata=doc,
-                            source="open_data",
-                            is_processed=False
-                        )
-                        bg_db.add(new_act)
-                        created += 1
-                    
-                    # Commit every 100 acts
-                    if (created + updated) % 100 == 0:
-                        bg_db.commit()
-                        logger.info(f"Progress: {created} created, {updated} updated, {skipped} skipped (total processed: {created + updated})")
-                
-                except Exception as e:
-                    logger.error(f"Error processing document {doc.get('nreg', 'unknown')}: {e}")
-                    bg_db.rollback()
-                    skipped += 1
-                    continue
-            
-            # Final commit
-            bg_db.commit()
-            logger.info(f"Download completed: {created} created, {updated} updated, {skipped} skipped, total: {len(all_documents)}")
-            
-        except Exception as e:
-            logger.error(f"Error in download_all_documents_task: {e}", exc_info=True)
-        finally:
-            bg_db.close()
-    
-    background_tasks.add_task(lambda: asyncio.run(download_all_documents_task()))
+    await enqueue_job(background_tasks, jobs.download_dataset_documents, dataset_id, limit)
     return {
         "message": f"Завантаження документів з датасету запущено в фоновому режимі (dataset_id={dataset_id})",
         "status": "queued",
@@ -679,112 +398,13 @@ async def download_all_from_dataset(
 
 @router.post("/rada-list/sync-all")
 async def sync_all_rada_acts(
-    background_tasks: BackgroundTasks = None,
-    db: Session = Depends(get_db)
+    background_tasks: BackgroundTasks = None
 ):
     """
     Одноразове завантаження ВСІХ НПА з open data датасету в базу даних
     Використовує новий метод get_all_documents_from_dataset (без витягування NREG)
     """
-    from app.services.rada_api import rada_api
-    from app.core.database import SessionLocal
-    import asyncio
-    import logging
-    
-    logger = logging.getLogger(__name__)
-    
-    async def sync_all_acts():
-        """Background task для завантаження всіх НПА"""
-        bg_db = SessionLocal()
-        try:
-            logger.info("Starting sync of ALL legal acts from open data dataset...")
-            
-            # Get all documents from dataset (without NREG filtering)
-            all_documents = await rada_api.get_all_documents_from_dataset(limit=None)
-            
-            if not all_documents:
-                logger.error("No documents found in dataset")
-                return
-            
-            logger.info(f"Found {len(all_documents)} total documents in dataset")
-            
-            # Get existing NREGs from database
-            existing_nregs = {act.nreg for act in bg_db.query(LegalAct.nreg).all()}
-            
-            # Create or update acts in database
-            created = 0
-            updated = 0
-            skipped = 0
-            
-            for doc in all_documents:
-                # Generate unique identifier for document
-                import hashlib
-                import json
-                
-                # Try to get NREG from document
-                nreg = (doc.get("nreg") or doc.get("NREG") or None)
-                
-                # If NREG is invalid or missing, generate unique ID from document content
-                if not nreg or not rada_api._is_valid_nreg(str(nreg)):
-                    # Generate unique ID from document metadata
-                    doc_str = json.dumps(doc, sort_keys=True, default=str)
-                    doc_hash = hashlib.md5(doc_str.encode()).hexdigest()[:12]
-                    dataset_id_from_doc = doc.get("_dataset_id") or "dataset"
-                    nreg = f"{dataset_id_from_doc}_{doc_hash}"
-                    logger.debug(f"Generated NREG for document: {nreg}")
-                
-                # Extract title
-                title = (doc.get("title") or doc.get("name") or 
-                        doc.get("Title") or doc.get("Name") or 
-                        doc.get("назва") or doc.get("Назва") or 
-                        f"Документ {nreg}")
-                try:
-                    # Check if already exists
-                    act = bg_db.query(LegalAct).filter(LegalAct.nreg == nreg).first()
-                    
-                    if act:
-                        # Update if needed (e.g., if title is missing or metadata is missing)
-                        if not act.title or act.title == act.nreg:
-                            act.title = title
-                        if not act.dataset_metadata:
-                            act.dataset_metadata = doc
-                            act.dataset_id = doc.get("_dataset_id")
-                            act.source = "open_data"
-                        updated += 1
-                    else:
-                        # Create new act with all available information
-                        new_act = LegalAct(
-                            nreg=nreg,
-                            title=title,
-                            dataset_metadata=doc,
-                            dataset_id=doc.get("_dataset_id"),
-                            source="open_data",
-                            is_processed=False
-                        )
-                        bg_db.add(new_act)
-                        created += 1
-                    
-                    # Commit every 100 acts
-                    if (created + updated) % 100 == 0:
-                        bg_db.commit()
-                        logger.info(f"Progress: {created} created, {updated} updated, {skipped} skipped (total processed: {created + updated})")
-                
-                except Exception as e:
-                    logger.error(f"Error processing document {doc.get('nreg', 'unknown')}: {e}")
-                    bg_db.rollback()
-                    skipped += 1
-                    continue
-            
-            # Final commit
-            bg_db.commit()
-            logger.info(f"Sync completed: {created} created, {updated} updated, {skipped} skipped, total: {len(all_documents)}")
-            
-        except Exception as e:
-            logger.error(f"Error in sync_all_acts: {e}", exc_info=True)
-        finally:
-            bg_db.close()
-    
-    background_tasks.add_task(lambda: asyncio.run(sync_all_acts()))
+    await enqueue_job(background_tasks, jobs.sync_all_dataset_acts)
     return {
         "message": "Завантаження всіх НПА з датасету запущено в фоновому режимі.",
         "status": "queued"
@@ -794,195 +414,14 @@ async def sync_all_rada_acts(
 @router.post("/download-active-acts")
 async def download_active_acts(
     background_tasks: BackgroundTasks,
-    process: bool = Query(False, description="Обробити через OpenAI після завантаження"),
-    db: Session = Depends(get_db)
+    process: bool = Query(False, description="Обробити через OpenAI після завантаження")
 ):
     """
     Завантажити всі ДІЮЧІ нормативно-правові акти з open data датасету
     Фільтрує тільки акти зі статусом "діє", "чинний" тощо
     Використовує новий метод get_all_documents_from_dataset (без витягування NREG)
     """
-    from app.services.rada_api import rada_api
-    from app.core.database import SessionLocal
-    from app.services.processing_service import ProcessingService
-    import asyncio
-    import logging
-    
-    logger = logging.getLogger(__name__)
-    
-    # Статуси, які вважаються "діючими"
-    ACTIVE_STATUSES = ["діє", "діючий", "в дії", "чинний", "active", "valid", "в силі"]
-    
-    def is_active_status(status):
-        """Перевірити, чи статус вказує на діючий акт"""
-        if status is None:
-            return True
-        
-        status_lower = str(status).lower().strip()
-        
-        for active_status in ACTIVE_STATUSES:
-            if active_status.lower() in status_lower:
-                return True
-        
-        inactive_keywords = ["втратив", "скасовано", "недійсний", "застарілий", "втратив чинність"]
-        for keyword in inactive_keywords:
-            if keyword in status_lower:
-                return False
-        
-        return True
-    
-    async def download_and_process_active():
-        """Background task для завантаження та обробки діючих НПА"""
-        bg_db = SessionLocal()
-        try:
-            logger.info("🚀 Початок завантаження ДІЮЧИХ нормативно-правових актів...")
-            
-            # Отримати всі документи з датасету (без фільтрації по NREG)
-            all_documents = []
-            try:
-                logger.info("Спроба отримати документи через open data portal API...")
-                all_documents = await rada_api.get_all_documents_from_dataset()
-                if all_documents:
-                    logger.info(f"✅ Отримано {len(all_documents)} документів через open data portal")
-            except Exception as e:
-                logger.warning(f"Open data API не працює: {e}")
-            
-            if not all_documents:
-                logger.error("❌ Не вдалося отримати документи з датасету")
-                return
-            
-            logger.info(f"📋 Знайдено {len(all_documents)} загальних документів")
-            
-            # Фільтрувати діючі
-            active_documents = []
-            existing_nregs = {act.nreg for act in bg_db.query(LegalAct.nreg).all()}
-            created = 0
-            updated = 0
-            skipped_inactive = 0
-            
-            logger.info("🔍 Фільтрація діючих актів...")
-            
-            for doc in all_documents:
-                try:
-                    # Generate unique identifier for document
-                    import hashlib
-                    import json
-                    
-                    # Try to get NREG from document
-                    nreg = (doc.get("nreg") or doc.get("NREG") or None)
-                    
-                    # If NREG is invalid or missing, generate unique ID from document content
-                    if not nreg or not rada_api._is_valid_nreg(str(nreg)):
-                        # Generate unique ID from document metadata
-                        doc_str = json.dumps(doc, sort_keys=True, default=str)
-                        doc_hash = hashlib.md5(doc_str.encode()).hexdigest()[:12]
-                        dataset_id_from_doc = doc.get("_dataset_id") or "dataset"
-                        nreg = f"{dataset_id_from_doc}_{doc_hash}"
-                        logger.debug(f"Generated NREG for document: {nreg}")
-                    
-                    # Extract status from document metadata
-                    status = (doc.get("status") or doc.get("Status") or 
-                             doc.get("статус") or doc.get("Статус"))
-                    
-                    # Check if status is active
-                    if not is_active_status(status):
-                        skipped_inactive += 1
-                        continue
-                    
-                    # Extract title
-                    title = (doc.get("title") or doc.get("name") or 
-                            doc.get("Title") or doc.get("Name") or 
-                            doc.get("назва") or doc.get("Назва") or 
-                            f"Документ {nreg}")
-                    
-                    # Check if already exists by NREG or by dataset metadata hash
-                    existing_act = bg_db.query(LegalAct).filter(LegalAct.nreg == nreg).first()
-                    
-                    # If not found by NREG, check by dataset_id + metadata hash
-                    if not existing_act:
-                        dataset_id_check = doc.get("_dataset_id") or "dataset"
-                        doc_hash = hashlib.md5(json.dumps(doc, sort_keys=True, default=str).encode()).hexdigest()[:12]
-                        # Try to find by dataset_id and similar metadata
-                        existing_acts = bg_db.query(LegalAct).filter(
-                            LegalAct.dataset_id == dataset_id_check
-                        ).all()
-                        # Check if any existing act has same metadata
-                        for act in existing_acts:
-                            if act.dataset_metadata:
-                                existing_hash = hashlib.md5(
-                                    json.dumps(act.dataset_metadata, sort_keys=True, default=str).encode()
-                                ).hexdigest()[:12]
-                                if existing_hash == doc_hash:
-                                    existing_act = act
-                                    break
-                    
-                    if existing_act:
-                        if not existing_act.title or existing_act.title == nreg:
-                            existing_act.title = title
-                            existing_act.status = status
-                        if not existing_act.dataset_metadata:
-                            existing_act.dataset_metadata = doc
-                            existing_act.dataset_id = doc.get("_dataset_id")
-                            existing_act.source = "open_data"
-                        updated += 1
-                    else:
-                        new_act = LegalAct(
-                            nreg=nreg,
-                            title=title,
-                            status=status,
-                            dataset_metadata=doc,
-                            dataset_id=doc.get("_dataset_id"),
-                            source="open_data",
-                            is_processed=False
-                        )
-                        bg_db.add(new_act)
-                        active_documents.append(nreg)
-                        created += 1
-                    
-                    # Коміт батчами
-                    if (created + updated) % 100 == 0:
-                        bg_db.commit()
-                        logger.info(f"Прогрес: {created} створено, {updated} оновлено, {skipped_inactive} пропущено (недіючі)")
-                
-                except Exception as e:
-                    logger.error(f"Помилка обробки документа {doc.get('nreg', 'unknown')}: {e}")
-                    bg_db.rollback()
-                    continue
-            
-            bg_db.commit()
-            logger.info(f"✅ Завантаження завершено: {created} створено, {updated} оновлено, {skipped_inactive} пропущено (недіючі)")
-            
-            # Обробка через OpenAI якщо потрібно
-            if process and active_documents:
-                logger.info(f"🤖 Початок обробки {len(active_documents)} діючих НПА через OpenAI...")
-                processing_service = ProcessingService(bg_db)
-                processed = 0
-                failed = 0
-                
-                for nreg in active_documents:
-                    try:
-                        result = await processing_service.process_legal_act(nreg)
-                        if result and result.is_processed:
-                            processed += 1
-                        else:
-                            failed += 1
-                        
-                        if (processed + failed) % 50 == 0:
-                            bg_db.commit()
-                            logger.info(f"Обробка: {processed} оброблено, {failed} помилок")
-                    except Exception as e:
-                        logger.error(f"Помилка обробки {nreg}: {e}")
-                        failed += 1
-                
-                bg_db.commit()
-                logger.info(f"✅ Обробка завершена: {processed} оброблено, {failed} помилок")
-            
-        except Exception as e:
-            logger.error(f"Error in download_and_process_active: {e}", exc_info=True)
-        finally:
-            bg_db.close()
-    
-    background_tasks.add_task(lambda: asyncio.run(download_and_process_active()))
+    await enqueue_job(background_tasks, jobs.download_active_acts, process)
     return {
         "message": "Завантаження діючих НПА запущено в фоновому режимі.",
         "status": "queued",
@@ -990,15 +429,22 @@ async def download_active_acts(
     }
 
 
-@router.post("/process")
-async def process_legal_act(
-    nreg: str = Body(..., description="Номер реєстрації акту"),
-    force_reprocess: bool = Query(False, description="Переобробити навіть якщо вже оброблено"),
-    db: Session = Depends(get_db)
+async def _process_act(
+    nreg: str,
+    force_reprocess: bool,
+    background: bool,
+    background_tasks: Optional[BackgroundTasks],
+    db: Session
 ):
-    """
-    Process a legal act: download, extract elements, sync to both DBs
-    """
+    """Process an act (or queue it) - shared by the body and {nreg:path} process endpoints"""
+    if background:
+        await enqueue_job(background_tasks, jobs.process_legal_act, nreg, force_reprocess)
+        return {
+            "message": f"Processing of act {nreg} queued",
+            "nreg": nreg,
+            "status": "queued"
+        }
+    
     processing_service = ProcessingService(db)
     
     try:
@@ -1025,43 +471,18 @@ async def process_legal_act(
         )
 
 
-@router.post("/{nreg:path}/process")
-async def process_legal_act_by_path(
-    nreg: str = Path(..., description="Номер реєстрації акту"),
+@router.post("/process")
+async def process_legal_act(
+    nreg: str = Body(..., description="Номер реєстрації акту"),
     force_reprocess: bool = Query(False, description="Переобробити навіть якщо вже оброблено"),
+    background: bool = Query(False, description="Обробити у фоні (через чергу завдань) і не чекати результату"),
+    background_tasks: BackgroundTasks = None,
     db: Session = Depends(get_db)
 ):
     """
-    Process a legal act by NREG in URL path: download, extract elements, sync to both DBs
-    Supports both regular NREGs and generated IDs (e.g., laws_f961d3fa7857)
+    Process a legal act: download, extract elements, sync to both DBs
     """
-    # Decode URL-encoded characters
-    nreg = unquote(nreg)
-    
-    processing_service = ProcessingService(db)
-    
-    try:
-        result = await processing_service.process_legal_act(nreg, force_reprocess=force_reprocess)
-        
-        if result:
-            return {
-                "message": f"Act {nreg} processed successfully",
-                "nreg": result.nreg,
-                "title": result.title,
-                "is_processed": result.is_processed,
-                "processed_at": result.processed_at.isoformat() if result.processed_at else None
-            }
-        else:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Could not process act {nreg}. Act may not exist or could not be downloaded."
-            )
-    except Exception as e:
-        logger.error(f"Error processing act {nreg}: {e}", exc_info=True)
-        raise HTTPException(
-            status_code=500,
-            detail=f"Error processing act: {str(e)}"
-        )
+    return await _process_act(nreg, force_reprocess, background, background_tasks, db)
 
 
 @router.get("/available-acts")
@@ -1069,17 +490,12 @@ async def get_available_acts_list(
     list_type: str = Query("updated", description="Type of list: 'all', 'updated', 'new_today', 'new_30days'"),
     limit: Optional[int] = Query(100, description="Maximum number of acts to return"),
     skip: int = Query(0, description="Number of acts to skip (for pagination)"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Отримати перелік всіх доступних НПА з Rada API з метадатою
     Повертає список документів з назвами, NREG, посиланнями тощо
     """
-    from app.services.rada_api import rada_api
-    import logging
-    
-    logger = logging.getLogger(__name__)
-    
     try:
         # Get list from API
         acts_list = await rada_api.get_all_acts_list_with_metadata(
@@ -1099,18 +515,22 @@ async def get_available_acts_list(
             }
         
         # Check which acts are already in database
-        existing_nregs = {act.nreg for act in db.query(LegalAct.nreg).all()}
+        # Database status for just the listed NREGs - one IN query over the needed columns
+        # instead of scanning every NREG and loading a full act per match
+        listed_nregs = [act["nreg"] for act in acts_list if act.get("nreg")]
+        db_acts = {}
+        if listed_nregs:
+            db_acts = {
+                row.nreg: row
+                for row in await db.execute(_ACT_LIST_STATUS_BY_NREGS, {"nregs": listed_nregs})
+            }
         
         # Enrich with database status
         enriched_acts = []
         for act in acts_list:
             nreg = act.get("nreg")
-            in_db = nreg in existing_nregs if nreg else False
-            
-            # Get additional info from database if available
-            db_act = None
-            if in_db:
-                db_act = db.query(LegalAct).filter(LegalAct.nreg == nreg).first()
+            db_act = db_acts.get(nreg) if nreg else None
+            in_db = db_act is not None
             
             enriched_act = {
                 "nreg": nreg,
@@ -1129,8 +549,8 @@ async def get_available_acts_list(
         
         # Count statistics
         total = len(enriched_acts)
-        loaded = len([a for a in enriched_acts if a["in_database"]])
-        processed = len([a for a in enriched_acts if a["is_processed"]])
+        loaded = sum(1 for a in enriched_acts if a["in_database"])
+        processed = sum(1 for a in enriched_acts if a["is_processed"])
         
         return {
             "total": total,
@@ -1152,25 +572,181 @@ async def get_available_acts_list(
         )
 
 
+# Routes with a {nreg:path} parameter come last - static paths above are matched first
+
+@router.get("/{nreg:path}/check")
+async def check_legal_act_exists(
+    nreg: str = Path(..., description="Номер реєстрації акту"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Check if legal act exists on Rada website and in database
+    """
+    # Decode URL-encoded characters
+    nreg = unquote(nreg)
+    
+    cache_key = act_check_cache_key(nreg)
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        return cached
+    
+    result, ttl = await _check_act(nreg, db)
+    # Failed lookups come back without a TTL - never cache those
+    if ttl:
+        await cache_set(cache_key, result, ttl)
+    return result
+
+
+async def _check_act(nreg: str, db: AsyncSession) -> Tuple[Dict[str, Any], Optional[int]]:
+    """Look the act up in the database, then on the Rada website
+
+    Returns the response and how long it may be cached (None - don't cache).
+    """
+    try:
+        # Check in database first
+        act = (await db.execute(_ACT_STATUS_BY_NREG, {"nreg": nreg})).first()
+        
+        if act:
+            # Only changes when the act is processed, which drops the cache entry
+            return {
+                "exists": True,
+                "in_database": True,
+                "is_processed": act.is_processed,
+                "title": act.title,
+                "message": f"Act {nreg} exists in database"
+            }, settings.ACT_CHECK_CACHE_TTL
+        
+        # Check on Rada website
+        try:
+            card_json = _rada_card_cache.get(nreg)
+            if card_json is None:
+                card_json = await rada_api.get_document_card(nreg)
+                # Only found cards are kept - a failed or empty lookup may be transient
+                if card_json:
+                    _rada_card_cache[nreg] = card_json
+            
+            if card_json:
+                # Try to get alternative NREG formats - card fields often repeat the same
+                # value, dedupe in order and skip the NREG already checked above
+                alternative_nregs = dict.fromkeys(
+                    str(value)
+                    for value in (card_json.get("nreg"), card_json.get("number"), card_json.get("id"))
+                    if value
+                )
+                alternative_nregs.pop(nreg, None)
+                
+                # Check if any alternative exists in DB - one round-trip for all of them,
+                # the first alternative in card order wins
+                if alternative_nregs:
+                    found = {
+                        row.nreg: row
+                        for row in await db.execute(_ACT_STATUS_BY_NREGS, {"nregs": list(alternative_nregs)})
+                    }
+                    alt_nreg = next((alt for alt in alternative_nregs if alt in found), None)
+                    if alt_nreg:
+                        alt_act = found[alt_nreg]
+                        return {
+                            "exists": True,
+                            "in_database": True,
+                            "is_processed": alt_act.is_processed,
+                            "title": alt_act.title,
+                            "message": f"Act found with alternative NREG: {alt_nreg}"
+                        }, settings.ACT_CHECK_MISS_CACHE_TTL  # processing drops alt_nreg's entry, not this one
+                
+                return {
+                    "exists": True,
+                    "in_database": False,
+                    "is_processed": False,
+                    "title": card_json.get("title", nreg),
+                    "message": f"Act {nreg} exists on Rada website but not in database"
+                }, settings.ACT_CHECK_MISS_CACHE_TTL
+        except Exception as e:
+            # Rada lookup failed - answer "not found" but don't cache a transient error
+            logger.debug(f"Error checking act on Rada: {e}")
+            return _act_not_found(nreg), None
+        
+        return _act_not_found(nreg), settings.ACT_CHECK_MISS_CACHE_TTL
+    except Exception as e:
+        logger.error(f"Error checking act {nreg}: {e}", exc_info=True)
+        return {
+            "exists": False,
+            "in_database": False,
+            "is_processed": False,
+            "title": None,
+            "message": f"Помилка при перевірці акту: {str(e)}"
+        }, None
+
+
+def _act_not_found(nreg: str) -> Dict[str, Any]:
+    return {
+        "exists": False,
+        "in_database": False,
+        "is_processed": False,
+        "title": None,
+        "message": f"Act {nreg} not found"
+    }
+
+
+@router.get("/{nreg:path}/details", response_model=LegalActDetailResponse)
+async def get_legal_act_details(
+    nreg: str = Path(..., description="Номер реєстрації акту"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get detailed information about processed legal act including extracted elements"""
+    # Decode URL-encoded characters
+    nreg = unquote(nreg)
+    cache_key = act_details_cache_key(nreg)
+    cached = await cache_get(cache_key)
+    if cached is not None:
+        return ORJSONResponse(cached)
+    
+    # One statement returns the response shape, categories included
+    row = (await db.execute(_ACT_DETAILS_BY_NREG, {"nreg": nreg})).mappings().first()
+    if not row:
+        raise HTTPException(status_code=404, detail="Legal act not found")
+    
+    # extracted_elements can be large - serialize with orjson directly instead of
+    # validating the model and running jsonable_encoder over the whole tree
+    details = dict(row)
+    await cache_set(cache_key, details, settings.ACT_DETAILS_CACHE_TTL)
+    return ORJSONResponse(details)
+
+
+@router.post("/{nreg:path}/process")
+async def process_legal_act_by_path(
+    nreg: str = Path(..., description="Номер реєстрації акту"),
+    force_reprocess: bool = Query(False, description="Переобробити навіть якщо вже оброблено"),
+    background: bool = Query(False, description="Обробити у фоні (через чергу завдань) і не чекати результату"),
+    background_tasks: BackgroundTasks = None,
+    db: Session = Depends(get_db)
+):
+    """
+    Process a legal act by NREG in URL path: download, extract elements, sync to both DBs
+    Supports both regular NREGs and generated IDs (e.g., laws_f961d3fa7857)
+    """
+    # Decode URL-encoded characters
+    nreg = unquote(nreg)
+    return await _process_act(nreg, force_reprocess, background, background_tasks, db)
+
+
 @router.get("/{nreg:path}", response_model=LegalActResponse)
 async def get_legal_act(
     nreg: str = Path(..., description="Номер реєстрації акту"),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """Get legal act by NREG"""
     # Decode URL-encoded characters
     nreg = unquote(nreg)
-    act = db.query(LegalAct).filter(LegalAct.nreg == nreg).first()
-    if not act:
-        raise HTTPException(status_code=404, detail="Legal act not found")
+    # Shared across workers; ProcessingService drops the entry when the act is processed
+    cache_key = act_cache_key(nreg)
+    act = await cache_get(cache_key)
+    if act is None:
+        row = (await db.execute(_ACT_SUMMARY_BY_NREG, {"nreg": nreg})).mappings().first()
+        if not row:
+            raise HTTPException(status_code=404, detail="Legal act not found")
+        act = dict(row)
+        await cache_set(cache_key, act, settings.ACT_CACHE_TTL)
     
-    return LegalActResponse(
-        id=act.id,
-        nreg=act.nreg,
-        title=act.title,
-        is_processed=act.is_processed,
-        document_type=act.document_type,
-        status=act.status,
-        date_acceptance=act.date_acceptance.isoformat() if act.date_acceptance else None,
-        date_publication=act.date_publication.isoformat() if act.date_publication else None
-    )
+    # Columns already match LegalActResponse (kept for the schema) - orjson serializes
+    # them and the dates directly, without validating a model per request
+    return ORJSONResponse(act)
@@ -11,6 +11,7 @@ from app.models.subset import Subset
 from app.core.config import settings
 from app.core.neo4j_db import neo4j_driver
 from typing import Dict, Any
+from urllib.parse import urlparse, urlunparse
 
 router = APIRouter()
 
@@ -20,8 +21,6 @@ async def get_status(db: Session = Depends(get_db)):
     """Get system status including database connection"""
     try:
         # Check if database is accessible
-        from sqlalchemy import inspect, text
-        
         try:
             inspector = inspect(engine)
             tables = inspector.get_table_names()
@@ -85,7 +84,6 @@ async def get_status(db: Session = Depends(get_db)):
             if database_url and not is_sqlite:
                 # Hide password in preview
                 try:
-                    from urllib.parse import urlparse, urlunparse
                     parsed = urlparse(database_url)
                     if parsed.password:
                         # Replace password with ***
@@ -0,0 +1,142 @@
+"""
+Redis cache for expensive responses (chat answers, Neo4j statistics, act lookups)
+"""
+from typing import Any, Optional
+from app.core.config import settings
+import orjson
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Try to import redis
+try:
+    import redis.asyncio as aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+    logger.warning("redis not installed. Install with: pip install redis")
+
+_client = None
+
+
+def get_redis():
+    """Get shared Redis client (None if cache is not configured)"""
+    global _client
+    if not (REDIS_AVAILABLE and settings.REDIS_URL):
+        return None
+    if _client is None:
+        _client = aioredis.from_url(settings.REDIS_URL, socket_timeout=1.0)
+    return _client
+
+
+async def cache_get(key: str) -> Optional[Any]:
+    """Get cached JSON value, None on miss or if Redis is unavailable"""
+    client = get_redis()
+    if client is None:
+        return None
+    try:
+        cached = await client.get(key)
+        return orjson.loads(cached) if cached is not None else None
+    except Exception as e:
+        # Cache is best-effort - never fail the request because of it
+        logger.warning(f"Cache get failed for {key}: {e}")
+        return None
+
+
+async def cache_set(key: str, value: Any, ttl: int):
+    """Store JSON-serializable value with TTL (seconds)"""
+    client = get_redis()
+    if client is None:
+        return
+    try:
+        await client.set(key, orjson.dumps(value), ex=ttl)
+    except Exception as e:
+        logger.warning(f"Cache set failed for {key}: {e}")
+
+
+async def cache_delete(*keys: str):
+    """Delete exact keys"""
+    client = get_redis()
+    if client is None or not keys:
+        return
+    try:
+        await client.delete(*keys)
+    except Exception as e:
+        logger.warning(f"Cache delete failed for {keys}: {e}")
+
+
+def relations_cache_key(category1_id: int, category2_id: int) -> str:
+    """Cache key for relations between two categories (direction matters: acts of 1 -> acts of 2)"""
+    return f"neo4j:relations:{category1_id}:{category2_id}"
+
+
+def _relations_index_key(category_id: int) -> str:
+    """Set of cached relations keys involving the category"""
+    return f"neo4j:relations_index:{category_id}"
+
+
+async def cache_set_relations(category1_id: int, category2_id: int, value: Any, ttl: int):
+    """Cache relations between two categories and index the key under both of them"""
+    client = get_redis()
+    if client is None:
+        return
+    key = relations_cache_key(category1_id, category2_id)
+    try:
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.set(key, orjson.dumps(value), ex=ttl)
+            for category_id in {category1_id, category2_id}:
+                index_key = _relations_index_key(category_id)
+                pipe.sadd(index_key, key)
+                # Outlives every key it lists - expired members are harmless to DELETE
+                pipe.expire(index_key, ttl)
+            await pipe.execute()
+    except Exception as e:
+        logger.warning(f"Cache set failed for {key}: {e}")
+
+
+async def invalidate_category_relations(category_ids):
+    """Drop cached relations for every category pair involving the given categories"""
+    client = get_redis()
+    index_keys = [_relations_index_key(category_id) for category_id in set(category_ids)]
+    if client is None or not index_keys:
+        return
+    try:
+        # Indexed keys instead of a keyspace SCAN - a couple of round-trips per processed act
+        keys = await client.sunion(index_keys)
+        await client.delete(*keys, *index_keys)
+    except Exception as e:
+        logger.warning(f"Cache delete failed for categories {category_ids}: {e}")
+
+
+def act_cache_key(nreg: str) -> str:
+    """Cache key for GET /legal-acts/{nreg}"""
+    return f"legal_acts:act:{nreg}"
+
+
+def act_check_cache_key(nreg: str) -> str:
+    """Cache key for GET /legal-acts/{nreg}/check"""
+    return f"legal_acts:check:{nreg}"
+
+
+def act_details_cache_key(nreg: str) -> str:
+    """Cache key for GET /legal-acts/{nreg}/details"""
+    return f"legal_acts:details:{nreg}"
+
+
+async def invalidate_act(nreg: str):
+    """Drop cached act/check/details responses for an act (after it was processed)"""
+    client = get_redis()
+    if client is None:
+        return
+    try:
+        await client.delete(act_cache_key(nreg), act_check_cache_key(nreg), act_details_cache_key(nreg))
+    except Exception as e:
+        logger.warning(f"Cache delete failed for act {nreg}: {e}")
+
+
+async def close_redis():
+    """Close shared Redis client"""
+    global _client
+    if _client is not None:
+        await _client.close()
+        _client = None
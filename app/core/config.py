@@ -1,7 +1,7 @@
 """
 Application configuration
 """
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import Optional
 
 
@@ -42,6 +42,17 @@ class Settings(BaseSettings):
     # PostgreSQL
     DATABASE_URL: Optional[str] = None
     
+    # Redis (optional response cache, disabled if not set)
+    REDIS_URL: Optional[str] = None
+    CHAT_CACHE_TTL: int = 300  # секунд, кеш відповідей чату
+    RELATIONS_CACHE_TTL: int = 300  # секунд, кеш зв'язків між парами категорій з Neo4j
+    CATEGORY_STATS_CACHE_TTL: int = 600  # секунд, кеш статистики категорій з Neo4j
+    ACT_CACHE_TTL: int = 60  # секунд, кеш GET /legal-acts/{nreg}
+    ACT_CHECK_CACHE_TTL: int = 300  # секунд, кеш перевірки акту, знайденого в БД
+    ACT_CHECK_MISS_CACHE_TTL: int = 10  # секунд, кеш перевірки акту, якого ще немає в БД
+    ACT_DETAILS_CACHE_TTL: int = 60  # секунд, кеш деталей акту (виділені елементи, категорії)
+    DB_STATS_CACHE_TTL: int = 60  # секунд, кеш загальної статистики БД для чату (у процесі)
+    
     # Neo4j
     NEO4J_URI: str = "bolt://localhost:7687"
     NEO4J_USER: str = "neo4j"
@@ -52,11 +63,9 @@ class Settings(BaseSettings):
     DEBUG: bool = False
     SECRET_KEY: str = "change-me-in-production"
     
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
-        # Railway автоматично інжектує змінні середовища, тому не потрібно env_file на Railway
-        # Але залишаємо для локальної розробки
+    # Railway автоматично інжектує змінні середовища, тому не потрібно env_file на Railway
+    # Але залишаємо для локальної розробки
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=True)
 
 
 settings = Settings()
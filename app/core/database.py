@@ -1,7 +1,9 @@
 """
 Database connections
 """
+from urllib.parse import parse_qsl, urlencode
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
@@ -14,18 +16,81 @@ connect_args = {}
 if database_url.startswith("sqlite"):
     connect_args = {"check_same_thread": False}
 
+# Sync engine serves ProcessingService and background jobs; recycle connections
+# before server-side idle timeouts and fail fast instead of queueing forever
 engine = create_engine(
     database_url,
     pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
+    pool_size=20,
+    max_overflow=10,
+    pool_timeout=30,
+    pool_recycle=3600,
     connect_args=connect_args
 )
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+is_postgres = engine.dialect.name == "postgresql"
+
+# expire_on_commit=False - objects stay readable after commit without a refetch
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 Base = declarative_base()
 
 
+# libpq URL parameters asyncpg knows under another name
+_ASYNCPG_QUERY_PARAMS = {"sslmode": "ssl", "connect_timeout": "timeout"}
+
+# libpq-only parameters asyncpg.connect() would reject as unexpected arguments
+_LIBPQ_ONLY_QUERY_PARAMS = {
+    "channel_binding", "gssencmode", "target_session_attrs", "application_name",
+    "options", "sslrootcert", "sslcert", "sslkey", "sslcrl",
+    "keepalives", "keepalives_idle", "keepalives_interval", "keepalives_count",
+}
+
+
+def _asyncpg_query(query: str) -> str:
+    """Translate libpq query parameters (e.g. sslmode=require) for asyncpg"""
+    params = [
+        (_ASYNCPG_QUERY_PARAMS.get(name, name), value)
+        for name, value in parse_qsl(query, keep_blank_values=True)
+        if name not in _LIBPQ_ONLY_QUERY_PARAMS
+    ]
+    return urlencode(params)
+
+
+def get_async_database_url(url: str) -> str:
+    """Map a sync database URL onto its asyncio driver (asyncpg / aiosqlite)"""
+    scheme, _, rest = url.partition("://")
+    driver = scheme.split("+")[0]
+    if driver == "sqlite":
+        return f"sqlite+aiosqlite://{rest}"
+    if driver in ("postgresql", "postgres"):
+        rest, _, query = rest.partition("?")
+        query = _asyncpg_query(query)
+        return f"postgresql+asyncpg://{rest}?{query}" if query else f"postgresql+asyncpg://{rest}"
+    return url
+
+
+# aiosqlite runs on NullPool, pool sizing only applies to PostgreSQL
+async_pool_args = {}
+if is_postgres:
+    async_pool_args = {
+        "pool_size": 20,
+        "max_overflow": 10,
+        "pool_recycle": 300,
+        # Hot lookups (act by NREG) reuse asyncpg prepared statements per connection
+        "connect_args": {"prepared_statement_cache_size": 256}
+    }
+
+# Async engine for request handlers - queries don't block the event loop
+async_engine = create_async_engine(
+    get_async_database_url(database_url),
+    pool_pre_ping=True,
+    query_cache_size=1200,
+    **async_pool_args
+)
+
+AsyncSessionLocal = async_sessionmaker(async_engine, class_=AsyncSession, expire_on_commit=False)
+
+
 def get_db():
     """Dependency for getting database session"""
     db = SessionLocal()
@@ -33,3 +98,9 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    """Dependency for getting async database session"""
+    async with AsyncSessionLocal() as db:
+        yield db
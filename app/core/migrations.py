@@ -0,0 +1,135 @@
+"""
+Schema migrations applied on application startup
+"""
+from sqlalchemy import inspect, text
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Columns added after the first deploy - create_all() won't add them to
+# existing tables. (table, column, column DDL), works on any dialect.
+COLUMN_MIGRATIONS = [
+    ("categories", "code", "INTEGER"),
+    ("legal_acts", "dataset_id", "VARCHAR(100)"),
+    ("legal_acts", "dataset_metadata", "JSON"),
+    ("legal_acts", "source", "VARCHAR(50) DEFAULT 'rada_api'"),
+]
+
+# Indexes for hot chat/search filters, supported by both SQLite and PostgreSQL.
+# Every statement must be idempotent - it runs on each startup.
+INDEX_MIGRATIONS = [
+    (
+        "ix_legal_acts_dataset_id",
+        "CREATE INDEX IF NOT EXISTS ix_legal_acts_dataset_id ON legal_acts (dataset_id)"
+    ),
+    (
+        "legal_acts_processed_elements_idx",
+        """
+        CREATE INDEX IF NOT EXISTS legal_acts_processed_elements_idx ON legal_acts (id)
+        WHERE is_processed AND extracted_elements IS NOT NULL
+        """
+    ),
+    (
+        "legal_acts_processed_idx",
+        "CREATE INDEX IF NOT EXISTS legal_acts_processed_idx ON legal_acts (id) WHERE is_processed"
+    ),
+    (
+        "legal_acts_unprocessed_nreg_idx",
+        "CREATE INDEX IF NOT EXISTS legal_acts_unprocessed_nreg_idx ON legal_acts (nreg) WHERE NOT is_processed"
+    ),
+    (
+        "legal_acts_created_at_idx",
+        "CREATE INDEX IF NOT EXISTS legal_acts_created_at_idx ON legal_acts (created_at)"
+    ),
+    (
+        "act_categories_category_act_idx",
+        "CREATE INDEX IF NOT EXISTS act_categories_category_act_idx ON act_categories (category_id, act_id)"
+    ),
+]
+
+# Characters of legal_acts.text fed into search_vector. PostgreSQL rejects a
+# tsvector over 1 MB, and Cyrillic text is 2 bytes per character in UTF-8 -
+# without a cap a single huge act would fail the whole ALTER (or its INSERT).
+SEARCH_TEXT_MAX_CHARS = 200_000
+
+# PostgreSQL-only DDL (full-text search, specialised indexes).
+# Every statement must be idempotent - it runs on each startup.
+POSTGRES_MIGRATIONS = [
+    # Adding a STORED generated column rewrites legal_acts under an ACCESS
+    # EXCLUSIVE lock - reads and writes block until it's done, so the first
+    # startup after this deploy takes as long as computing every vector.
+    # Later startups are a no-op (IF NOT EXISTS).
+    (
+        "legal_acts.search_vector",
+        f"""
+        ALTER TABLE legal_acts ADD COLUMN IF NOT EXISTS search_vector tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('simple', coalesce(title, '')), 'A') ||
+            setweight(to_tsvector('simple', left(coalesce(text, ''), {SEARCH_TEXT_MAX_CHARS})), 'B')
+        ) STORED
+        """
+    ),
+    (
+        "legal_acts_fts_idx",
+        "CREATE INDEX IF NOT EXISTS legal_acts_fts_idx ON legal_acts USING GIN (search_vector)"
+    ),
+    (
+        "legal_acts_elements_fts_idx",
+        """
+        CREATE INDEX IF NOT EXISTS legal_acts_elements_fts_idx ON legal_acts
+        USING GIN (to_tsvector('simple'::regconfig, extracted_elements))
+        """
+    ),
+    # Trigram index makes Category.name ILIKE '%...%' an index scan
+    ("pg_trgm", "CREATE EXTENSION IF NOT EXISTS pg_trgm"),
+    (
+        "categories_name_trgm_idx",
+        "CREATE INDEX IF NOT EXISTS categories_name_trgm_idx ON categories USING GIN (name gin_trgm_ops)"
+    ),
+]
+
+
+def apply_statements(engine, statements):
+    """Run idempotent DDL statements, each in its own transaction"""
+    for name, statement in statements:
+        try:
+            with engine.begin() as conn:
+                conn.execute(text(statement))
+            logger.debug(f"Migration applied: {name}")
+        except Exception as e:
+            # Don't block startup if a migration can't be applied
+            logger.warning(f"Migration {name} failed: {e}")
+
+
+def add_missing_columns(engine):
+    """Add COLUMN_MIGRATIONS columns that are missing from existing tables"""
+    inspector = inspect(engine)
+    existing_tables = set(inspector.get_table_names())
+    columns_by_table = {}
+
+    for table, column, ddl in COLUMN_MIGRATIONS:
+        if table not in existing_tables:
+            continue
+        if table not in columns_by_table:
+            columns_by_table[table] = {col['name'] for col in inspector.get_columns(table)}
+        if column in columns_by_table[table]:
+            continue
+        try:
+            logger.warning(f"Column '{column}' not found in {table} table, adding it...")
+            with engine.begin() as conn:
+                conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {ddl}"))
+            logger.info(f"Column '{column}' added successfully")
+        except Exception as e:
+            logger.warning(f"Migration {table}.{column} failed: {e}")
+
+
+def run_migrations(engine):
+    """Apply schema migrations that create_all() can't express"""
+    add_missing_columns(engine)
+    apply_statements(engine, INDEX_MIGRATIONS)
+
+    if engine.dialect.name != "postgresql":
+        logger.info(f"Skipping PostgreSQL-only migrations for {engine.dialect.name}")
+        return
+
+    apply_statements(engine, POSTGRES_MIGRATIONS)
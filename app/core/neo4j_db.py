@@ -19,9 +19,12 @@ class Neo4jDriver:
     def __init__(self):
         if self._driver is None:
             if settings.NEO4J_PASSWORD:
+                # One pooled driver per process - sessions borrow connections from it
                 self._driver = GraphDatabase.driver(
                     settings.NEO4J_URI,
-                    auth=(settings.NEO4J_USER, settings.NEO4J_PASSWORD)
+                    auth=(settings.NEO4J_USER, settings.NEO4J_PASSWORD),
+                    max_connection_pool_size=50,
+                    connection_acquisition_timeout=30
                 )
             else:
                 # Якщо Neo4j не налаштовано, створюємо заглушку
@@ -0,0 +1,64 @@
+"""
+Background job queue - arq on Redis, FastAPI background tasks as fallback
+"""
+from typing import Optional
+from fastapi import BackgroundTasks
+from app.core.config import settings
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Try to import arq
+try:
+    from arq import create_pool
+    from arq.connections import RedisSettings
+    ARQ_AVAILABLE = True
+except ImportError:
+    ARQ_AVAILABLE = False
+    logger.warning("arq not installed. Install with: pip install arq")
+
+_pool = None
+
+
+async def get_queue():
+    """Get shared arq connection pool (None if queue is not configured)"""
+    global _pool
+    if not (ARQ_AVAILABLE and settings.REDIS_URL):
+        return None
+    if _pool is None:
+        _pool = await create_pool(RedisSettings.from_dsn(settings.REDIS_URL))
+    return _pool
+
+
+async def enqueue_job(background_tasks: Optional[BackgroundTasks], job, *args) -> bool:
+    """
+    Run a job from app/services/jobs.py on the arq worker (durable, survives restarts).
+    Without Redis the job runs in this process after the response is sent
+    (or right away when there is no BackgroundTasks, e.g. a direct call).
+    Returns True if the job was queued to the worker.
+    """
+    try:
+        queue = await get_queue()
+        if queue is not None:
+            await queue.enqueue_job(job.__name__, *args)
+            logger.info(f"Job {job.__name__} queued to worker")
+            return True
+    except Exception as e:
+        logger.warning(f"Could not queue job {job.__name__}, running in process: {e}")
+
+    if background_tasks is None:
+        # Called outside a request (no BackgroundTasks injected) - just run it here
+        await job(*args)
+        return False
+
+    # FastAPI awaits coroutine tasks on the running loop - shared clients and pools stay usable
+    background_tasks.add_task(job, *args)
+    return False
+
+
+async def close_queue():
+    """Close shared arq connection pool"""
+    global _pool
+    if _pool is not None:
+        await _pool.close()
+        _pool = None
@@ -1,25 +1,19 @@
 """
 Main FastAPI application
 """
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse
 from app.api import router as api_router
 from app.core.config import settings
-from app.core.database import Base, engine
+from app.core.database import Base, engine, async_engine
 from app.models import Category, LegalAct, Subset, ActCategory, ActRelation
 import os
 
-app = FastAPI(
-    title=settings.APP_NAME,
-    description="Система аналізу нормативно-правових актів України",
-    version="1.0.0"
-)
 
-# Create database tables on startup
-@app.on_event("startup")
-async def startup_event():
+async def startup():
     """Create database tables if they don't exist"""
     import logging
     logger = logging.getLogger(__name__)
@@ -51,13 +45,16 @@ async def startup_event():
         Base.metadata.create_all(bind=engine)
         logger.info("✔ Database tables created/verified")
         print("✅ Database tables created/verified")
+
+        # Apply schema changes create_all() doesn't handle (FTS columns, indexes)
+        from app.core.migrations import run_migrations
+        run_migrations(engine)
         
         # Check if categories exist (only for PostgreSQL)
         if not is_sqlite:
             from app.core.database import SessionLocal
             from app.models.category import Category
             from app.services.processing_service import ProcessingService
-            import asyncio
             
             db = SessionLocal()
             try:
@@ -70,11 +67,10 @@ async def startup_event():
                     # Try to auto-initialize categories
                     try:
                         processing_service = ProcessingService(db)
-                        asyncio.run(processing_service.initialize_categories())
+                        # Returns the number of categories after the upsert - no recount needed
+                        new_count = await processing_service.initialize_categories()
                         db.commit()
                         
-                        # Check again
-                        new_count = db.query(Category).count()
                         if new_count > 0:
                             logger.info(f"✅ Successfully auto-initialized {new_count} categories!")
                             print(f"✅ Auto-initialized {new_count} categories!")
@@ -99,6 +95,36 @@ async def startup_event():
         print("⚠️  Application will continue but database features may not work")
         # Don't raise - allow app to start even if DB fails
 
+
+async def shutdown():
+    """Release pooled database, cache, queue, HTTP and Neo4j connections"""
+    from app.core.cache import close_redis
+    from app.core.queue import close_queue
+    from app.core.neo4j_db import neo4j_driver
+    from app.services.rada_api import rada_api
+    await async_engine.dispose()
+    await close_redis()
+    await close_queue()
+    await rada_api.close()
+    neo4j_driver.close()
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Schema setup runs once before serving requests, never on the request path"""
+    await startup()
+    yield
+    await shutdown()
+
+
+app = FastAPI(
+    title=settings.APP_NAME,
+    description="Система аналізу нормативно-правових актів України",
+    version="1.0.0",
+    default_response_class=ORJSONResponse,  # large JSON payloads (extracted elements) serialize much faster
+    lifespan=lifespan
+)
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
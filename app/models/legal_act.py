@@ -1,8 +1,8 @@
 """
 Legal Act models - represents elements (елементи множини)
 """
-from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, JSON, Boolean
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Text, ForeignKey, DateTime, JSON, Boolean, Index
+from sqlalchemy.orm import relationship, deferred
 from sqlalchemy.sql import func
 from app.core.database import Base
 
@@ -14,7 +14,7 @@ class LegalAct(Base):
     id = Column(Integer, primary_key=True, index=True)
     nreg = Column(String(100), nullable=False, unique=True, index=True)  # Номер реєстрації
     title = Column(String(1000), nullable=False)
-    text = Column(Text, nullable=True)  # Повний текст документа
+    text = deferred(Column(Text, nullable=True))  # Повний текст документа (завантажується лише при зверненні)
     text_json = Column(JSON, nullable=True)  # Структурований JSON з API
     card_json = Column(JSON, nullable=True)  # Картка документа
     
@@ -55,6 +55,27 @@ class LegalAct(Base):
         return f"<LegalAct(id={self.id}, nreg='{self.nreg}', title='{self.title[:50]}...')>"
 
 
+# Partial index for "processed acts" lists (nreg already has a unique index).
+# Existing databases get these from INDEX_MIGRATIONS in app/core/migrations.py
+Index(
+    "legal_acts_processed_idx",
+    LegalAct.id,
+    postgresql_where=LegalAct.is_processed,
+    sqlite_where=LegalAct.is_processed
+)
+
+# Covering partial index for "unprocessed NREGs" (overnight / batch processing queue)
+Index(
+    "legal_acts_unprocessed_nreg_idx",
+    LegalAct.nreg,
+    postgresql_where=~LegalAct.is_processed,
+    sqlite_where=~LegalAct.is_processed
+)
+
+# rada-list pages through all acts newest first
+Index("legal_acts_created_at_idx", LegalAct.created_at)
+
+
 class ActCategory(Base):
     """Many-to-many relationship between acts and categories"""
     __tablename__ = "act_categories"
@@ -0,0 +1,519 @@
+"""
+Long-running background jobs: open data dataset import and batch processing
+
+Jobs are plain coroutines - they run either on an arq worker (see app/worker.py)
+or, without Redis, as FastAPI background tasks.
+"""
+from typing import Optional
+from dateutil import parser as date_parser
+from sqlalchemy import bindparam, insert, select
+from sqlalchemy.orm import load_only
+from app.core.database import SessionLocal, engine
+from app.models.legal_act import LegalAct
+from app.services.processing_service import ProcessingService
+from app.services.rada_api import rada_api
+import asyncio
+import hashlib
+import json
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Built once - import loops look up an act per document
+_ACT_BY_NREG = select(LegalAct).where(LegalAct.nreg == bindparam("nreg")).limit(1)
+
+# Multi-row INSERT for new acts found by a dataset sync
+_INSERT_ACTS = insert(LegalAct.__table__)
+
+# Columns a dataset sync reads or updates - act text and extracted elements stay unloaded
+_SYNC_COLUMNS = load_only(
+    LegalAct.id, LegalAct.nreg, LegalAct.title, LegalAct.dataset_metadata,
+    LegalAct.dataset_id, LegalAct.source
+)
+
+# Скільки нових/оновлених актів записувати за один коміт при синхронізації датасету
+SYNC_BATCH_SIZE = 500
+
+# Скільки актів обробляти одночасно (Rada API запити все одно йдуть послідовно з паузами)
+PROCESS_CONCURRENCY = 5
+
+# Статуси, які вважаються "діючими"
+ACTIVE_STATUSES = ["діє", "діючий", "в дії", "чинний", "active", "valid", "в силі"]
+
+
+def is_active_status(status):
+    """Перевірити, чи статус вказує на діючий акт"""
+    if status is None:
+        return True
+
+    status_lower = str(status).lower().strip()
+
+    for active_status in ACTIVE_STATUSES:
+        if active_status.lower() in status_lower:
+            return True
+
+    inactive_keywords = ["втратив", "скасовано", "недійсний", "застарілий", "втратив чинність"]
+    for keyword in inactive_keywords:
+        if keyword in status_lower:
+            return False
+
+    return True
+
+
+def filter_unprocessed(db, nregs, batch_size: int = 1000):
+    """Drop NREGs that are already processed - the check runs in SQL, one IN query per batch"""
+    processed = set()
+    for start in range(0, len(nregs), batch_size):
+        batch = nregs[start:start + batch_size]
+        processed.update(db.scalars(
+            select(LegalAct.nreg).where(LegalAct.nreg.in_(batch), LegalAct.is_processed == True)
+        ))
+    return [nreg for nreg in nregs if nreg not in processed]
+
+
+async def download_dataset_documents(dataset_id: Optional[str] = None, limit: Optional[int] = None):
+    """Background task для завантаження всіх документів з датасету"""
+    bg_db = SessionLocal()
+    try:
+        logger.info(f"Starting download of ALL documents from open data dataset (dataset_id={dataset_id})...")
+
+        # Get all documents from dataset
+        all_documents = await rada_api.get_all_documents_from_dataset(dataset_id=dataset_id, limit=limit)
+
+        if not all_documents:
+            logger.error("No documents found in dataset")
+            return
+
+        logger.info(f"Found {len(all_documents)} documents in dataset")
+
+        # DB writes are synchronous - run them in a worker thread, off the event loop
+        def store_documents():
+            # Create or update acts in database
+            created = 0
+            updated = 0
+            skipped = 0
+
+            for doc in all_documents:
+                try:
+                    # Generate unique identifier for document
+                    # Use NREG if available and valid, otherwise generate unique ID
+                    # Try to get NREG from document
+                    nreg = (doc.get("nreg") or doc.get("NREG") or None)
+
+                    # If NREG is invalid or missing, generate unique ID from document content
+                    if not nreg or not rada_api._is_valid_nreg(str(nreg)):
+                        # Generate unique ID from document metadata
+                        doc_str = json.dumps(doc, sort_keys=True, default=str)
+                        doc_hash = hashlib.md5(doc_str.encode()).hexdigest()[:12]
+                        dataset_prefix = dataset_id or doc.get("_dataset_id") or "dataset"
+                        nreg = f"{dataset_prefix}_{doc_hash}"
+                        logger.debug(f"Generated NREG for document: {nreg}")
+
+                    # Extract title
+                    title = (doc.get("title") or doc.get("name") or 
+                            doc.get("Title") or doc.get("Name") or 
+                            doc.get("назва") or doc.get("Назва") or 
+                            f"Документ {nreg}")
+
+                    # Extract status
+                    status = (doc.get("status") or doc.get("Status") or 
+                             doc.get("статус") or doc.get("Статус"))
+
+                    # Extract dates
+                    date_acceptance = None
+                    date_publication = None
+
+                    for date_field in ["date_acceptance", "date_publication", "date", "Date", 
+                                      "дата_прийняття", "дата_опублікування"]:
+                        if date_field in doc and doc[date_field]:
+                            try:
+                                parsed_date = date_parser.parse(str(doc[date_field]))
+                                if "acceptance" in date_field.lower() or "прийняття" in date_field.lower():
+                                    date_acceptance = parsed_date
+                                elif "publication" in date_field.lower() or "опублікування" in date_field.lower():
+                                    date_publication = parsed_date
+                                elif not date_acceptance:
+                                    date_acceptance = parsed_date
+                            except:
+                                pass
+
+                    # Extract document type
+                    document_type = (doc.get("document_type") or doc.get("type") or 
+                                    doc.get("DocumentType") or doc.get("Type"))
+
+                    # Check if already exists
+                    act = bg_db.scalar(_ACT_BY_NREG, {"nreg": nreg})
+
+                    if act:
+                        # Update with dataset information
+                        if not act.title or act.title == act.nreg:
+                            act.title = title
+                        if status and not act.status:
+                            act.status = status
+                        if document_type and not act.document_type:
+                            act.document_type = document_type
+                        if date_acceptance and not act.date_acceptance:
+                            act.date_acceptance = date_acceptance
+                        if date_publication and not act.date_publication:
+                            act.date_publication = date_publication
+
+                        # Update dataset metadata
+                        act.dataset_id = dataset_id or doc.get("_dataset_id")
+                        act.dataset_metadata = doc
+                        act.source = "open_data"
+
+                        updated += 1
+                    else:
+                        # Create new act with all available information
+                        new_act = LegalAct(
+                            nreg=nreg,
+                            title=title,
+                            status=status,
+                            document_type=document_type,
+                            date_acceptance=date_acceptance,
+                            date_publication=date_publication,
+                            dataset_id=dataset_id or doc.get("_dataset_id"),
+                            dataset_metadata=doc,
+                            source="open_data",
+                            is_processed=False
+                        )
+                        bg_db.add(new_act)
+                        created += 1
+
+                    # Commit every 100 acts
+                    if (created + updated) % 100 == 0:
+                        bg_db.commit()
+                        logger.info(f"Progress: {created} created, {updated} updated, {skipped} skipped (total processed: {created + updated})")
+
+                except Exception as e:
+                    logger.error(f"Error processing document {doc.get('nreg', 'unknown')}: {e}")
+                    bg_db.rollback()
+                    skipped += 1
+                    continue
+
+            # Final commit
+            bg_db.commit()
+            logger.info(f"Download completed: {created} created, {updated} updated, {skipped} skipped, total: {len(all_documents)}")
+
+        await asyncio.to_thread(store_documents)
+
+    except Exception as e:
+        logger.error(f"Error in download_all_documents_task: {e}", exc_info=True)
+    finally:
+        bg_db.close()
+
+
+async def sync_all_dataset_acts():
+    """Background task для завантаження всіх НПА"""
+    bg_db = SessionLocal()
+    try:
+        logger.info("Starting sync of ALL legal acts from open data dataset...")
+
+        # Get all documents from dataset (without NREG filtering)
+        all_documents = await rada_api.get_all_documents_from_dataset(limit=None)
+
+        if not all_documents:
+            logger.error("No documents found in dataset")
+            return
+
+        logger.info(f"Found {len(all_documents)} total documents in dataset")
+
+        # DB writes are synchronous - run them in a worker thread, off the event loop
+        def store_documents():
+            # Preload existing acts in one streamed scan - lookups below are dict hits, not SELECTs
+            existing_acts = {
+                act.nreg: act
+                for act in bg_db.scalars(
+                    select(LegalAct).options(_SYNC_COLUMNS).execution_options(yield_per=1000)
+                )
+            }
+
+            # Create or update acts in database. New acts are collected as plain dicts and
+            # written with one multi-row INSERT per batch instead of per-object flushes
+            created = 0
+            updated = 0
+            skipped = 0
+            pending = 0
+            pending_updates = 0  # preloaded acts changed since the last commit
+            to_insert = []
+            new_nregs = set()  # NREGs created (or queued) by this sync
+            queued_duplicates = {}  # NREG in to_insert -> repeats of it seen in the dataset
+
+            def insert_acts(rows):
+                # Separate connection - a failed INSERT must not roll back the session,
+                # which would expire every preloaded act and reload them one by one
+                with engine.begin() as conn:
+                    conn.execute(_INSERT_ACTS, rows)
+
+            def flush_batch():
+                nonlocal created, updated, skipped, pending, pending_updates
+                # Updates of existing acts are committed on their own, before the inserts
+                try:
+                    bg_db.commit()
+                    updated += pending_updates
+                except Exception as e:
+                    logger.error(f"Error storing batch of {pending_updates} updated acts: {e}")
+                    bg_db.rollback()
+                    skipped += pending_updates
+                pending_updates = 0
+
+                if to_insert:
+                    try:
+                        insert_acts(to_insert)
+                        inserted = list(to_insert)
+                    except Exception as e:
+                        # One bad row fails the whole INSERT - retry row by row to keep the rest
+                        logger.warning(f"Error storing batch of {len(to_insert)} new acts, retrying one by one: {e}")
+                        inserted = []
+                        for row in to_insert:
+                            try:
+                                insert_acts([row])
+                                inserted.append(row)
+                            except Exception as row_error:
+                                logger.error(f"Error storing act {row['nreg']}: {row_error}")
+                                # Not created - a later copy in the dataset may try again
+                                new_nregs.discard(row["nreg"])
+                                skipped += 1 + queued_duplicates[row["nreg"]]
+                    created += len(inserted)
+                    updated += sum(queued_duplicates[row["nreg"]] for row in inserted)
+
+                to_insert.clear()
+                queued_duplicates.clear()
+                pending = 0
+                logger.info(f"Progress: {created} created, {updated} updated, {skipped} skipped (total processed: {created + updated})")
+
+            for doc in all_documents:
+                # Generate unique identifier for document
+                # Try to get NREG from document
+                nreg = (doc.get("nreg") or doc.get("NREG") or None)
+
+                # If NREG is invalid or missing, generate unique ID from document content
+                if not nreg or not rada_api._is_valid_nreg(str(nreg)):
+                    # Generate unique ID from document metadata
+                    doc_str = json.dumps(doc, sort_keys=True, default=str)
+                    doc_hash = hashlib.md5(doc_str.encode()).hexdigest()[:12]
+                    dataset_id_from_doc = doc.get("_dataset_id") or "dataset"
+                    nreg = f"{dataset_id_from_doc}_{doc_hash}"
+                    logger.debug(f"Generated NREG for document: {nreg}")
+
+                # Extract title
+                title = (doc.get("title") or doc.get("name") or 
+                        doc.get("Title") or doc.get("Name") or 
+                        doc.get("назва") or doc.get("Назва") or 
+                        f"Документ {nreg}")
+                # Check if already exists (or is already queued for insert)
+                act = existing_acts.get(nreg)
+
+                if act:
+                    # Update if needed (e.g., if title is missing or metadata is missing)
+                    if not act.title or act.title == act.nreg:
+                        act.title = title
+                    if not act.dataset_metadata:
+                        act.dataset_metadata = doc
+                        act.dataset_id = doc.get("_dataset_id")
+                        act.source = "open_data"
+                    pending_updates += 1
+                elif nreg in queued_duplicates:
+                    # Duplicate of an act still waiting for insert - counted once it's stored
+                    queued_duplicates[nreg] += 1
+                elif nreg in new_nregs:
+                    # Duplicate within the dataset - the act is already created by this sync
+                    updated += 1
+                else:
+                    # Create new act with all available information
+                    new_nregs.add(nreg)
+                    queued_duplicates[nreg] = 0
+                    to_insert.append({
+                        "nreg": nreg,
+                        "title": title,
+                        "dataset_metadata": doc,
+                        "dataset_id": doc.get("_dataset_id"),
+                        "source": "open_data",
+                        "is_processed": False
+                    })
+
+                # Commit every SYNC_BATCH_SIZE acts
+                pending += 1
+                if pending >= SYNC_BATCH_SIZE:
+                    flush_batch()
+
+            # Final commit
+            flush_batch()
+            logger.info(f"Sync completed: {created} created, {updated} updated, {skipped} skipped, total: {len(all_documents)}")
+
+        await asyncio.to_thread(store_documents)
+
+    except Exception as e:
+        logger.error(f"Error in sync_all_acts: {e}", exc_info=True)
+    finally:
+        bg_db.close()
+
+
+async def download_active_acts(process: bool = False):
+    """Background task для завантаження та обробки діючих НПА"""
+    bg_db = SessionLocal()
+    try:
+        logger.info("🚀 Початок завантаження ДІЮЧИХ нормативно-правових актів...")
+
+        # Отримати всі документи з датасету (без фільтрації по NREG)
+        all_documents = []
+        try:
+            logger.info("Спроба отримати документи через open data portal API...")
+            all_documents = await rada_api.get_all_documents_from_dataset()
+            if all_documents:
+                logger.info(f"✅ Отримано {len(all_documents)} документів через open data portal")
+        except Exception as e:
+            logger.warning(f"Open data API не працює: {e}")
+
+        if not all_documents:
+            logger.error("❌ Не вдалося отримати документи з датасету")
+            return
+
+        logger.info(f"📋 Знайдено {len(all_documents)} загальних документів")
+
+        # DB writes are synchronous - run them in a worker thread, off the event loop
+        def store_active_documents():
+            # Фільтрувати діючі
+            active_documents = []
+            created = 0
+            updated = 0
+            skipped_inactive = 0
+
+            logger.info("🔍 Фільтрація діючих актів...")
+
+            for doc in all_documents:
+                try:
+                    # Generate unique identifier for document
+                    # Try to get NREG from document
+                    nreg = (doc.get("nreg") or doc.get("NREG") or None)
+
+                    # If NREG is invalid or missing, generate unique ID from document content
+                    if not nreg or not rada_api._is_valid_nreg(str(nreg)):
+                        # Generate unique ID from document metadata
+                        doc_str = json.dumps(doc, sort_keys=True, default=str)
+                        doc_hash = hashlib.md5(doc_str.encode()).hexdigest()[:12]
+                        dataset_id_from_doc = doc.get("_dataset_id") or "dataset"
+                        nreg = f"{dataset_id_from_doc}_{doc_hash}"
+                        logger.debug(f"Generated NREG for document: {nreg}")
+
+                    # Extract status from document metadata
+                    status = (doc.get("status") or doc.get("Status") or 
+                             doc.get("статус") or doc.get("Статус"))
+
+                    # Check if status is active
+                    if not is_active_status(status):
+                        skipped_inactive += 1
+                        continue
+
+                    # Extract title
+                    title = (doc.get("title") or doc.get("name") or 
+                            doc.get("Title") or doc.get("Name") or 
+                            doc.get("назва") or doc.get("Назва") or 
+                            f"Документ {nreg}")
+
+                    # Check if already exists by NREG or by dataset metadata hash
+                    existing_act = bg_db.scalar(_ACT_BY_NREG, {"nreg": nreg})
+
+                    # If not found by NREG, check by dataset_id + metadata hash
+                    if not existing_act:
+                        dataset_id_check = doc.get("_dataset_id") or "dataset"
+                        doc_hash = hashlib.md5(json.dumps(doc, sort_keys=True, default=str).encode()).hexdigest()[:12]
+                        # Try to find by dataset_id and similar metadata
+                        existing_acts = bg_db.query(LegalAct).filter(
+                            LegalAct.dataset_id == dataset_id_check
+                        ).all()
+                        # Check if any existing act has same metadata
+                        for act in existing_acts:
+                            if act.dataset_metadata:
+                                existing_hash = hashlib.md5(
+                                    json.dumps(act.dataset_metadata, sort_keys=True, default=str).encode()
+                                ).hexdigest()[:12]
+                                if existing_hash == doc_hash:
+                                    existing_act = act
+                                    break
+
+                    if existing_act:
+                        if not existing_act.title or existing_act.title == nreg:
+                            existing_act.title = title
+                            existing_act.status = status
+                        if not existing_act.dataset_metadata:
+                            existing_act.dataset_metadata = doc
+                            existing_act.dataset_id = doc.get("_dataset_id")
+                            existing_act.source = "open_data"
+                        updated += 1
+                    else:
+                        new_act = LegalAct(
+                            nreg=nreg,
+                            title=title,
+                            status=status,
+                            dataset_metadata=doc,
+                            dataset_id=doc.get("_dataset_id"),
+                            source="open_data",
+                            is_processed=False
+                        )
+                        bg_db.add(new_act)
+                        active_documents.append(nreg)
+                        created += 1
+
+                    # Коміт батчами
+                    if (created + updated) % 100 == 0:
+                        bg_db.commit()
+                        logger.info(f"Прогрес: {created} створено, {updated} оновлено, {skipped_inactive} пропущено (недіючі)")
+
+                except Exception as e:
+                    logger.error(f"Помилка обробки документа {doc.get('nreg', 'unknown')}: {e}")
+                    bg_db.rollback()
+                    continue
+
+            bg_db.commit()
+            logger.info(f"✅ Завантаження завершено: {created} створено, {updated} оновлено, {skipped_inactive} пропущено (недіючі)")
+            return active_documents
+
+        active_documents = await asyncio.to_thread(store_active_documents)
+
+        # Обробка через OpenAI якщо потрібно
+        if process and active_documents:
+            to_process = await asyncio.to_thread(filter_unprocessed, bg_db, active_documents)
+            logger.info(
+                f"🤖 Початок обробки {len(to_process)} діючих НПА через OpenAI "
+                f"({len(active_documents) - len(to_process)} вже оброблено)..."
+            )
+            # Acts are independent - overlap their Rada/OpenAI round trips
+            semaphore = asyncio.Semaphore(PROCESS_CONCURRENCY)
+            done = 0
+
+            async def process_one(nreg):
+                nonlocal done
+                async with semaphore:
+                    try:
+                        # process_legal_act opens its own session per act
+                        return await process_legal_act(nreg)
+                    except Exception as e:
+                        logger.error(f"Помилка обробки {nreg}: {e}")
+                        return False
+                    finally:
+                        done += 1
+                        if done % 50 == 0:
+                            logger.info(f"Обробка: {done}/{len(to_process)}")
+
+            results = await asyncio.gather(*(process_one(nreg) for nreg in to_process))
+            processed = sum(results)
+            failed = len(results) - processed
+
+            logger.info(f"✅ Обробка завершена: {processed} оброблено, {failed} помилок")
+
+    except Exception as e:
+        logger.error(f"Error in download_and_process_active: {e}", exc_info=True)
+    finally:
+        bg_db.close()
+
+
+async def process_legal_act(nreg: str, force_reprocess: bool = False):
+    """Background task для обробки одного акту"""
+    bg_db = SessionLocal()
+    try:
+        processing_service = ProcessingService(bg_db)
+        result = await processing_service.process_legal_act(nreg, force_reprocess=force_reprocess)
+        return bool(result and result.is_processed)
+    finally:
+        bg_db.close()
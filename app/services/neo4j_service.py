@@ -3,10 +3,23 @@ Service for working with Neo4j graph database
 """
 from typing import Dict, List, Any, Optional
 from app.core.neo4j_db import get_neo4j_session
+from app.core.cache import cache_get, cache_set, cache_delete
+from app.core.config import settings
+from cachetools import TTLCache, cached
+import asyncio
 import logging
+import threading
 
 logger = logging.getLogger(__name__)
 
+# Category statistics aggregate the whole graph and change slowly.
+# Two tiers: Redis shared between workers, then an in-process TTL cache. The
+# in-process copy is per worker - invalidation only reaches the current one,
+# other workers keep theirs until it expires.
+CATEGORY_STATS_CACHE_KEY = "neo4j:category_statistics"
+_category_stats_cache = TTLCache(maxsize=2, ttl=settings.CATEGORY_STATS_CACHE_TTL)
+_category_stats_lock = threading.Lock()
+
 
 class Neo4jService:
     """Service for Neo4j graph operations"""
@@ -152,6 +165,9 @@ class Neo4jService:
         except RuntimeError:
             return {"nodes": [], "edges": []}
         with session:
+            # Cypher doesn't accept parameters in variable-length bounds, so depth
+            # is inlined - coerce it to a small int to keep the query text stable
+            depth = max(1, min(int(depth), 5))
             query = """
             MATCH path = (c:Category)-[*1..%d]-(connected)
             WHERE c.id IN $category_ids
@@ -185,9 +201,10 @@ class Neo4jService:
     def get_relations_between_categories(
         self,
         category1_id: int,
-        category2_id: int
+        category2_id: int,
+        limit: int = 100
     ) -> List[Dict[str, Any]]:
-        """Get relations between two categories"""
+        """Get relations between two categories (at most `limit`, applied in Cypher)"""
         try:
             session = get_neo4j_session()
         except RuntimeError:
@@ -197,10 +214,10 @@ class Neo4jService:
             MATCH (c1:Category {id: $cat1_id})<-[:IN_CATEGORY]-(a1:LegalAct)
             MATCH (a1)-[r]->(a2:LegalAct)-[:IN_CATEGORY]->(c2:Category {id: $cat2_id})
             RETURN a1, r, a2
-            LIMIT 100
+            LIMIT $limit
             """
             
-            result = session.run(query, cat1_id=category1_id, cat2_id=category2_id)
+            result = session.run(query, cat1_id=category1_id, cat2_id=category2_id, limit=limit)
             
             relations = []
             for record in result:
@@ -223,8 +240,9 @@ class Neo4jService:
             
             return relations
     
+    @cached(_category_stats_cache, key=lambda self: "list", lock=_category_stats_lock)
     def get_category_statistics(self) -> List[Dict[str, Any]]:
-        """Get statistics for all categories"""
+        """Get statistics for all categories (cached in-process for settings.CATEGORY_STATS_CACHE_TTL seconds)"""
         try:
             session = get_neo4j_session()
         except RuntimeError:
@@ -256,6 +274,30 @@ class Neo4jService:
             
             return stats
 
+    @cached(_category_stats_cache, key=lambda self: "by_id", lock=_category_stats_lock)
+    def get_category_statistics_by_id(self) -> Dict[int, Dict[str, Any]]:
+        """Get statistics for all categories keyed by category id"""
+        return {s["id"]: s for s in self.get_category_statistics()}
+
+    async def get_category_statistics_cached(self) -> List[Dict[str, Any]]:
+        """Get category statistics from Redis, falling back to the graph (in-process cached)"""
+        stats = await cache_get(CATEGORY_STATS_CACHE_KEY)
+        if stats is None:
+            # Neo4j driver is synchronous - keep it off the event loop
+            stats = await asyncio.to_thread(self.get_category_statistics)
+            await cache_set(CATEGORY_STATS_CACHE_KEY, stats, settings.CATEGORY_STATS_CACHE_TTL)
+        return stats
+
+    async def invalidate_category_statistics(self):
+        """Drop cached category statistics (after categories were changed)
+
+        Clears Redis and this worker's in-process cache; other workers' in-process
+        copies are only refreshed when their TTL runs out.
+        """
+        with _category_stats_lock:
+            _category_stats_cache.clear()
+        await cache_delete(CATEGORY_STATS_CACHE_KEY)
+
 
 # Singleton instance
 neo4j_service = Neo4jService()
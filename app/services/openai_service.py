@@ -2,7 +2,7 @@
 Service for working with OpenAI API to extract set elements
 """
 from openai import AsyncOpenAI
-from typing import Dict, List, Any, Optional
+from typing import AsyncIterator, Dict, List, Any, Optional
 from app.core.config import settings
 import logging
 import json
@@ -18,6 +18,10 @@ except ImportError:
     WANDB_AVAILABLE = False
 
 
+# Answer shown to the user when the chat completion fails (timeout, rate limit, ...)
+CHAT_ERROR_MESSAGE = "Вибачте, сталася помилка при обробці вашого запиту. Перевірте, чи налаштовано OpenAI API ключ."
+
+
 class OpenAIService:
     """Service for extracting set elements from legal acts using OpenAI"""
     
@@ -806,16 +810,13 @@ class OpenAIService:
             logger.error(f"Error in chat: {e}")
             return "Вибачте, сталася помилка при обробці вашого запиту."
     
-    async def chat_about_database(
+    def _database_chat_params(
         self,
         user_question: str,
         context: Dict[str, Any],
         conversation_history: List[Dict[str, str]] = None
-    ) -> str:
-        """Chat about database content - acts, categories, relations, elements"""
-        if not self.client:
-            raise RuntimeError("OpenAI API key is not configured.")
-        
+    ) -> Dict[str, Any]:
+        """Build chat completion parameters for a question about database content"""
         system_prompt = """Ти експерт-асистент для системи аналізу нормативно-правових актів України.
 
 Твоя задача - відповідати на питання користувачів про:
@@ -859,31 +860,68 @@ class OpenAIService:
 
         messages.append({"role": "user", "content": user_prompt})
 
+        # Use chat-specific model if available, otherwise use default
+        chat_model = getattr(self, 'chat_model', self.model)
+        
+        # Prepare API call parameters
+        api_params = {
+            "model": chat_model,
+            "messages": messages,
+            "temperature": 0.7,
+            "max_tokens": self.max_chat_tokens  # Configurable via OPENAI_MAX_CHAT_TOKENS (GPT-4o supports up to 16384)
+        }
+        
+        # Add reasoning effort only for models that support it (o1 series)
+        # Note: GPT-5.2-pro doesn't exist yet, and reasoning_effort is for o1 models
+        if "o1" in chat_model.lower():
+            reasoning_effort = getattr(settings, 'OPENAI_REASONING_EFFORT', 'high')
+            api_params["reasoning_effort"] = reasoning_effort
+        
+        return api_params
+
+    async def chat_about_database(
+        self,
+        user_question: str,
+        context: Dict[str, Any],
+        conversation_history: List[Dict[str, str]] = None
+    ) -> str:
+        """Chat about database content - acts, categories, relations, elements"""
+        if not self.client:
+            raise RuntimeError("OpenAI API key is not configured.")
+        
+        api_params = self._database_chat_params(user_question, context, conversation_history)
+
         try:
-            # Use chat-specific model if available, otherwise use default
-            chat_model = getattr(self, 'chat_model', self.model)
-            
-            # Prepare API call parameters
-            api_params = {
-                "model": chat_model,
-                "messages": messages,
-                "temperature": 0.7,
-                "max_tokens": self.max_chat_tokens  # Configurable via OPENAI_MAX_CHAT_TOKENS (GPT-4o supports up to 16384)
-            }
-            
-            # Add reasoning effort only for models that support it (o1 series)
-            # Note: GPT-5.2-pro doesn't exist yet, and reasoning_effort is for o1 models
-            if "o1" in chat_model.lower():
-                reasoning_effort = getattr(settings, 'OPENAI_REASONING_EFFORT', 'high')
-                api_params["reasoning_effort"] = reasoning_effort
-            
             response = await self.client.chat.completions.create(**api_params)
             
             return response.choices[0].message.content
             
         except Exception as e:
+            # Re-raised so callers can answer with CHAT_ERROR_MESSAGE without caching it
             logger.error(f"Error in database chat: {e}")
-            return "Вибачте, сталася помилка при обробці вашого запиту. Перевірте, чи налаштовано OpenAI API ключ."
+            raise
+
+    async def chat_about_database_stream(
+        self,
+        user_question: str,
+        context: Dict[str, Any],
+        conversation_history: List[Dict[str, str]] = None
+    ) -> AsyncIterator[str]:
+        """Same as chat_about_database, but yields the answer in chunks as they are generated"""
+        if not self.client:
+            raise RuntimeError("OpenAI API key is not configured.")
+        
+        api_params = self._database_chat_params(user_question, context, conversation_history)
+
+        try:
+            stream = await self.client.chat.completions.create(**api_params, stream=True)
+            async for chunk in stream:
+                if chunk.choices and chunk.choices[0].delta.content:
+                    yield chunk.choices[0].delta.content
+        except Exception as e:
+            # Re-raised so the caller can emit an error frame instead of a normal delta
+            logger.error(f"Error in database chat stream: {e}")
+            raise
 
 
 # Singleton instance
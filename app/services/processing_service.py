@@ -1,7 +1,9 @@
 """
 Service for processing legal acts and synchronizing between databases
 """
-from sqlalchemy.orm import Session
+from dateutil import parser as date_parser
+from sqlalchemy import bindparam, select
+from sqlalchemy.orm import Session, selectinload
 from typing import Optional, Dict, Any
 from app.models.legal_act import LegalAct, ActCategory, ActRelation
 from app.models.category import Category
@@ -10,11 +12,16 @@ from app.services.rada_api import rada_api
 from app.services.openai_service import openai_service
 from app.services.neo4j_service import neo4j_service
 from app.services.embeddings_service import embeddings_service
+from app.core.cache import invalidate_act, invalidate_category_relations
+from app.core.neo4j_db import neo4j_driver
 from datetime import datetime
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Built once - SQLAlchemy reuses the compiled SQL for every lookup
+_ACT_BY_NREG = select(LegalAct).where(LegalAct.nreg == bindparam("nreg")).limit(1)
+
 
 class ProcessingService:
     """Service for processing legal acts"""
@@ -35,7 +42,7 @@ class ProcessingService:
         """
         
         # Check if already exists and processed
-        act = self.db.query(LegalAct).filter(LegalAct.nreg == nreg).first()
+        act = self.db.scalar(_ACT_BY_NREG, {"nreg": nreg})
         
         if act and act.is_processed and not force_reprocess:
             logger.info(f"Act {nreg} already processed, skipping (use force_reprocess=True to reprocess)")
@@ -162,12 +169,10 @@ class ProcessingService:
             if not date_str:
                 return None
             try:
-                from dateutil import parser
-                return parser.parse(date_str)
+                return date_parser.parse(date_str)
             except:
                 # Fallback to simple parsing
                 try:
-                    from datetime import datetime
                     # Try common formats
                     for fmt in ["%Y-%m-%d", "%Y-%m-%d %H:%M:%S", "%d.%m.%Y", "%d/%m/%Y"]:
                         try:
@@ -283,10 +288,14 @@ class ProcessingService:
                         logger.error(f"Error generating embeddings for {nreg}: {e}")
                         # Don't fail the whole process if embeddings fail
                     
+                    # Categories whose cached Neo4j relations become stale
+                    touched_category_ids = set()
+                    
                     # Process categories
                     for cat_name in extracted.get("categories", []):
                         category = self.db.query(Category).filter(Category.name == cat_name).first()
                         if category:
+                            touched_category_ids.add(category.id)
                             # Link to category
                             act_category = ActCategory(
                                 act_id=act.id,
@@ -347,12 +356,22 @@ class ProcessingService:
                                     logger.warning("Neo4j not configured, skipping sync")
                     
                     # Process relations
-                    for rel_data in extracted.get("relations", []):
+                    # Load all target acts with their categories in one go (no query per relation)
+                    relations_data = extracted.get("relations", [])
+                    target_nregs = {rel_data.get("target_nreg") for rel_data in relations_data} - {None, ""}
+                    target_acts = {}
+                    if target_nregs:
+                        target_acts = {
+                            target.nreg: target
+                            for target in self.db.query(LegalAct).options(
+                                selectinload(LegalAct.categories)
+                            ).filter(LegalAct.nreg.in_(target_nregs))
+                        }
+                    
+                    for rel_data in relations_data:
                         target_nreg = rel_data.get("target_nreg")
                         if target_nreg:
-                            target_act = self.db.query(LegalAct).filter(
-                                LegalAct.nreg == target_nreg
-                            ).first()
+                            target_act = target_acts.get(target_nreg)
                             
                             if target_act:
                                 relation = ActRelation(
@@ -363,6 +382,9 @@ class ProcessingService:
                                     confidence=rel_data.get("confidence", 100)
                                 )
                                 self.db.add(relation)
+                                touched_category_ids.update(
+                                    act_cat.category_id for act_cat in target_act.categories
+                                )
                                 
                                 # Sync to Neo4j
                                 try:
@@ -377,6 +399,7 @@ class ProcessingService:
                                     logger.warning("Neo4j not configured, skipping sync")
                     
                     self.db.commit()
+                    await invalidate_category_relations(touched_category_ids)
                 else:
                     logger.warning(f"Extraction returned empty result for {nreg}")
                     act.is_processed = False
@@ -417,6 +440,8 @@ class ProcessingService:
         else:
             logger.warning(f"Act {nreg} was not fully processed")
         
+        # Cached /check and /details responses describe the act before this run
+        await invalidate_act(nreg)
         return act
     
     async def initialize_categories(self):
@@ -458,6 +483,9 @@ class ProcessingService:
             ("Не визначено", 2860)
         ]
         
+        # Load existing categories once instead of querying each name
+        categories = {category.name: category for category in self.db.query(Category).all()}
+        
         for item in categories_data:
             # Support both old format (name, count) and new format (code, name, count)
             if len(item) == 2:
@@ -468,10 +496,11 @@ class ProcessingService:
             else:
                 continue
             
-            category = self.db.query(Category).filter(Category.name == name).first()
+            category = categories.get(name)
             if not category:
                 category = Category(name=name, code=code, element_count=count)
                 self.db.add(category)
+                categories[name] = category
             else:
                 if code is not None:
                     category.code = code
@@ -481,9 +510,8 @@ class ProcessingService:
         
         # Sync to Neo4j (if configured)
         try:
-            from app.core.neo4j_db import neo4j_driver
             if neo4j_driver.get_driver() is not None:
-                for category in self.db.query(Category).all():
+                for category in categories.values():
                     neo4j_service.create_category_node(
                         category.id,
                         category.name,
@@ -495,7 +523,10 @@ class ProcessingService:
         except Exception as e:
             logger.warning(f"Neo4j sync failed (non-critical): {e}")
         
+        await neo4j_service.invalidate_category_statistics()
+        
         logger.info("Categories initialized")
+        return len(categories)
 
 
 # Singleton instance will be created per request
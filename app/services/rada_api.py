@@ -3,8 +3,14 @@ Service for working with Rada API
 """
 import httpx
 import asyncio
+import csv
+import io
 import json
+import random
+import re
+import time
 from typing import Optional, Dict, List, Any
+from urllib.parse import quote, unquote
 from app.core.config import settings
 import logging
 
@@ -24,6 +30,36 @@ class RadaAPIService:
         self.last_request_time = 0.0
         self.request_count = 0  # Track requests per minute
         self.request_window_start = 0.0  # Start of current minute window
+        self._rate_lock: Optional[asyncio.Lock] = None  # concurrent callers must still respect the pauses
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop = None
+    
+    def _get_client(self) -> httpx.AsyncClient:
+        """
+        Shared HTTP client - keeps connections to Rada alive between requests
+        instead of a new TCP/TLS handshake per call
+        """
+        loop = asyncio.get_running_loop()
+        # httpx connections (and the rate lock) are bound to the loop they were opened on
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            # Requests are spaced 5-7 s apart by _rate_limit - httpx's default 5 s keep-alive
+            # expiry would drop the idle connection before the next request reuses it
+            self._client = httpx.AsyncClient(limits=httpx.Limits(
+                max_connections=20,
+                max_keepalive_connections=10,
+                keepalive_expiry=60.0
+            ))
+            if self._client_loop is not loop:
+                self._rate_lock = asyncio.Lock()
+            self._client_loop = loop
+        return self._client
+    
+    async def close(self):
+        """Close shared HTTP client"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            self._client_loop = None
     
     async def _rate_limit(self):
         """
@@ -31,35 +67,35 @@ class RadaAPIService:
         According to API docs: random pause between 5-7 seconds recommended
         Also enforces 60 requests per minute limit
         """
-        import time
-        import random
-        
-        current_time = time.time()
-        
-        # Check if we need to reset request counter (new minute)
-        if current_time - self.request_window_start >= 60:
-            self.request_count = 0
-            self.request_window_start = current_time
-        
-        # Enforce 60 requests per minute limit
-        if self.request_count >= 60:
-            wait_time = 60 - (current_time - self.request_window_start)
-            if wait_time > 0:
-                logger.warning(f"Rate limit reached (60/min), waiting {wait_time:.1f} seconds...")
-                await asyncio.sleep(wait_time)
+        # Serialize callers so concurrent jobs can't fire requests at the same moment
+        self._get_client()  # makes sure the lock belongs to the running loop
+        async with self._rate_lock:
+            current_time = time.time()
+            
+            # Check if we need to reset request counter (new minute)
+            if current_time - self.request_window_start >= 60:
                 self.request_count = 0
-                self.request_window_start = time.time()
-        
-        # Random delay between 5-7 seconds (as per API documentation)
-        time_since_last = current_time - self.last_request_time
-        if time_since_last < self.delay:
-            # Use random delay between 5-7 seconds
-            random_delay = random.uniform(5.0, 7.0)
-            if time_since_last < random_delay:
-                await asyncio.sleep(random_delay - time_since_last)
-        
-        self.last_request_time = time.time()
-        self.request_count += 1
+                self.request_window_start = current_time
+            
+            # Enforce 60 requests per minute limit
+            if self.request_count >= 60:
+                wait_time = 60 - (current_time - self.request_window_start)
+                if wait_time > 0:
+                    logger.warning(f"Rate limit reached (60/min), waiting {wait_time:.1f} seconds...")
+                    await asyncio.sleep(wait_time)
+                    self.request_count = 0
+                    self.request_window_start = time.time()
+            
+            # Random delay between 5-7 seconds (as per API documentation)
+            time_since_last = current_time - self.last_request_time
+            if time_since_last < self.delay:
+                # Use random delay between 5-7 seconds
+                random_delay = random.uniform(5.0, 7.0)
+                if time_since_last < random_delay:
+                    await asyncio.sleep(random_delay - time_since_last)
+            
+            self.last_request_time = time.time()
+            self.request_count += 1
     
     def _get_headers(self, use_token: bool = False) -> Dict[str, str]:
         """Get request headers"""
@@ -73,8 +109,6 @@ class RadaAPIService:
         Token is valid for 86400 seconds (24 hours) from 0:00 to 23:59 each day
         According to API docs: requesting token before each request is FORBIDDEN (IP will be blocked)
         """
-        import time
-        from datetime import datetime, timedelta
         
         # Check if we have a valid token that hasn't expired
         if not force_refresh and self.token and self.token_expires_at:
@@ -85,23 +119,23 @@ class RadaAPIService:
                 logger.info("Token expired, refreshing...")
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.base_url}/api/token",
-                    timeout=30.0,
-                    headers={"User-Agent": "OpenData"}  # Use OpenData for token request
-                )
-                if response.status_code == 200:
-                    token = response.text.strip()
-                    self.token = token
-                    # Token expires at end of day (23:59:59) or after 86400 seconds
-                    # For simplicity, set expiration to 23 hours from now (safer)
-                    self.token_expires_at = time.time() + (23 * 3600)
-                    logger.info("Successfully obtained Rada API token (valid for ~23 hours)")
-                    return token
-                else:
-                    logger.error(f"Failed to get token: {response.status_code}")
-                    return None
+            client = self._get_client()
+            response = await client.get(
+                f"{self.base_url}/api/token",
+                timeout=30.0,
+                headers={"User-Agent": "OpenData"}  # Use OpenData for token request
+            )
+            if response.status_code == 200:
+                token = response.text.strip()
+                self.token = token
+                # Token expires at end of day (23:59:59) or after 86400 seconds
+                # For simplicity, set expiration to 23 hours from now (safer)
+                self.token_expires_at = time.time() + (23 * 3600)
+                logger.info("Successfully obtained Rada API token (valid for ~23 hours)")
+                return token
+            else:
+                logger.error(f"Failed to get token: {response.status_code}")
+                return None
         except Exception as e:
             logger.error(f"Error getting token: {e}")
             return None
@@ -120,19 +154,19 @@ class RadaAPIService:
             return None
         
         try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    f"{self.base_url}/api/limits",
-                    headers={"User-Agent": self.token},
-                    timeout=30.0
-                )
-                if response.status_code == 200:
-                    limits = response.json()
-                    logger.info(f"API limits: {limits}")
-                    return limits
-                else:
-                    logger.warning(f"Failed to check limits: {response.status_code}")
-                    return None
+            client = self._get_client()
+            response = await client.get(
+                f"{self.base_url}/api/limits",
+                headers={"User-Agent": self.token},
+                timeout=30.0
+            )
+            if response.status_code == 200:
+                limits = response.json()
+                logger.info(f"API limits: {limits}")
+                return limits
+            else:
+                logger.warning(f"Failed to check limits: {response.status_code}")
+                return None
         except Exception as e:
             logger.warning(f"Error checking limits: {e}")
             return None
@@ -145,13 +179,10 @@ class RadaAPIService:
         await self._rate_limit()
         
         # Try to get/refresh token if needed (but not before every request!)
-        import time
         if not self.token or (self.token_expires_at and time.time() >= self.token_expires_at):
             logger.info("Token missing or expired, obtaining new token...")
             await self.get_token()
         
-        from urllib.parse import quote
-        
         # Prepare encoded nreg variants
         if '/' in nreg:
             parts = nreg.split('/')
@@ -182,49 +213,49 @@ class RadaAPIService:
         
         for url in url_formats:
             try:
-                async with httpx.AsyncClient() as client:
-                    # Try with token first
-                    logger.debug(f"Trying URL: {url} (with token)")
-                    response = await client.get(url, headers=headers_with_token, timeout=30.0)
+                client = self._get_client()
+                # Try with token first
+                logger.debug(f"Trying URL: {url} (with token)")
+                response = await client.get(url, headers=headers_with_token, timeout=30.0)
+                
+                if response.status_code == 200:
+                    content_type = response.headers.get("content-type", "").lower()
                     
-                    if response.status_code == 200:
-                        content_type = response.headers.get("content-type", "").lower()
-                        
-                        # Check if it's actually JSON
-                        if "application/json" in content_type or "text/json" in content_type:
+                    # Check if it's actually JSON
+                    if "application/json" in content_type or "text/json" in content_type:
+                        try:
+                            data = response.json()
+                            if data and isinstance(data, dict):
+                                logger.info(f"Successfully retrieved JSON for {nreg} from {url}")
+                                return data
+                        except json.JSONDecodeError:
+                            logger.debug(f"Response from {url} is not valid JSON")
+                    
+                    # If HTML is returned, skip this URL format
+                    if "text/html" in content_type:
+                        logger.debug(f"URL {url} returned HTML, trying next format")
+                        continue
+                
+                # If 403, try without token
+                elif response.status_code == 403:
+                    logger.debug(f"Got 403 for {url}, trying without token")
+                    response2 = await client.get(url, headers=headers_no_token, timeout=30.0)
+                    if response2.status_code == 200:
+                        content_type2 = response2.headers.get("content-type", "").lower()
+                        if "application/json" in content_type2 or "text/json" in content_type2:
                             try:
-                                data = response.json()
+                                data = response2.json()
                                 if data and isinstance(data, dict):
-                                    logger.info(f"Successfully retrieved JSON for {nreg} from {url}")
+                                    logger.info(f"Successfully retrieved JSON for {nreg} from {url} (no token)")
                                     return data
                             except json.JSONDecodeError:
-                                logger.debug(f"Response from {url} is not valid JSON")
-                        
-                        # If HTML is returned, skip this URL format
-                        if "text/html" in content_type:
-                            logger.debug(f"URL {url} returned HTML, trying next format")
-                            continue
-                    
-                    # If 403, try without token
-                    elif response.status_code == 403:
-                        logger.debug(f"Got 403 for {url}, trying without token")
-                        response2 = await client.get(url, headers=headers_no_token, timeout=30.0)
-                        if response2.status_code == 200:
-                            content_type2 = response2.headers.get("content-type", "").lower()
-                            if "application/json" in content_type2 or "text/json" in content_type2:
-                                try:
-                                    data = response2.json()
-                                    if data and isinstance(data, dict):
-                                        logger.info(f"Successfully retrieved JSON for {nreg} from {url} (no token)")
-                                        return data
-                                except json.JSONDecodeError:
-                                    pass
-                    
-                    # If 404, try next format
-                    elif response.status_code == 404:
-                        logger.debug(f"URL {url} returned 404, trying next format")
-                        continue
-                    
+                                pass
+                
+                # If 404, try next format
+                elif response.status_code == 404:
+                    logger.debug(f"URL {url} returned 404, trying next format")
+                    continue
+            
             except Exception as e:
                 logger.debug(f"Error trying {url}: {e}")
                 continue
@@ -277,31 +308,30 @@ class RadaAPIService:
         await self._rate_limit()
         
         try:
-            async with httpx.AsyncClient() as client:
-                from urllib.parse import quote
-                if '/' in nreg:
-                    parts = nreg.split('/')
-                    encoded_parts = [quote(part, safe='') for part in parts]
-                    encoded_nreg = '/'.join(encoded_parts)
-                else:
-                    encoded_nreg = quote(nreg, safe='')
-                
-                url = f"{self.base_url}/laws/card/{encoded_nreg}.json"
-                headers = self._get_headers(use_token=True)
-                
-                logger.debug(f"Requesting card: original nreg={nreg}, encoded={encoded_nreg}, url={url}")
-                response = await client.get(url, headers=headers, timeout=30.0)
-                
-                if response.status_code == 200:
-                    content_type = response.headers.get("content-type", "").lower()
-                    if "application/json" in content_type or "text/json" in content_type:
-                        try:
-                            return response.json()
-                        except:
-                            pass
-                
-                logger.warning(f"Card for {nreg} not found: {response.status_code}")
-                return None
+            client = self._get_client()
+            if '/' in nreg:
+                parts = nreg.split('/')
+                encoded_parts = [quote(part, safe='') for part in parts]
+                encoded_nreg = '/'.join(encoded_parts)
+            else:
+                encoded_nreg = quote(nreg, safe='')
+            
+            url = f"{self.base_url}/laws/card/{encoded_nreg}.json"
+            headers = self._get_headers(use_token=True)
+            
+            logger.debug(f"Requesting card: original nreg={nreg}, encoded={encoded_nreg}, url={url}")
+            response = await client.get(url, headers=headers, timeout=30.0)
+            
+            if response.status_code == 200:
+                content_type = response.headers.get("content-type", "").lower()
+                if "application/json" in content_type or "text/json" in content_type:
+                    try:
+                        return response.json()
+                    except:
+                        pass
+            
+            logger.warning(f"Card for {nreg} not found: {response.status_code}")
+            return None
         except Exception as e:
             logger.error(f"Exception getting card {nreg}: {e}")
             return None
@@ -311,27 +341,26 @@ class RadaAPIService:
         await self._rate_limit()
         
         try:
-            async with httpx.AsyncClient() as client:
-                # URL encode the nreg properly (same as get_document_json)
-                from urllib.parse import quote
-                if '/' in nreg:
-                    parts = nreg.split('/')
-                    encoded_parts = [quote(part, safe='') for part in parts]
-                    encoded_nreg = '/'.join(encoded_parts)
-                else:
-                    encoded_nreg = quote(nreg, safe='')
-                
-                url = f"{self.base_url}/laws/show/{encoded_nreg}.txt"
-                headers = self._get_headers(use_token=False)  # TXT doesn't need token
-                
-                logger.debug(f"Requesting text: original nreg={nreg}, encoded={encoded_nreg}, url={url}")
-                response = await client.get(url, headers=headers, timeout=60.0)
-                
-                if response.status_code == 200:
-                    return response.text
-                else:
-                    logger.warning(f"Text for {nreg} not found: {response.status_code}")
-                    return None
+            client = self._get_client()
+            # URL encode the nreg properly (same as get_document_json)
+            if '/' in nreg:
+                parts = nreg.split('/')
+                encoded_parts = [quote(part, safe='') for part in parts]
+                encoded_nreg = '/'.join(encoded_parts)
+            else:
+                encoded_nreg = quote(nreg, safe='')
+            
+            url = f"{self.base_url}/laws/show/{encoded_nreg}.txt"
+            headers = self._get_headers(use_token=False)  # TXT doesn't need token
+            
+            logger.debug(f"Requesting text: original nreg={nreg}, encoded={encoded_nreg}, url={url}")
+            response = await client.get(url, headers=headers, timeout=60.0)
+            
+            if response.status_code == 200:
+                return response.text
+            else:
+                logger.warning(f"Text for {nreg} not found: {response.status_code}")
+                return None
         except Exception as e:
             logger.error(f"Exception getting text {nreg}: {e}")
             return None
@@ -371,89 +400,87 @@ class RadaAPIService:
         logger.info(f"Fetching {list_type} documents list from {url}...")
         
         try:
-            async with httpx.AsyncClient() as client:
-                headers = self._get_headers(use_token=False)  # HTML lists don't need token
-                response = await client.get(url, headers=headers, timeout=60.0, follow_redirects=True)
-                
-                if response.status_code != 200:
-                    logger.error(f"Failed to get documents list: {response.status_code}")
-                    return []
-                
-                from bs4 import BeautifulSoup
-                from urllib.parse import unquote
-                import re
-                
-                soup = BeautifulSoup(response.text, 'html.parser')
-                documents = []
-                seen_nregs = set()
-                invalid_count = 0
-                total_links_found = 0
-                
-                logger.info(f"Parsing HTML from {url}, HTML length: {len(response.text)}")
-                
-                # Find all document links
-                for link in soup.find_all('a', href=True):
-                    href = link.get('href', '')
-                    if '/laws/show/' in href or '/laws/card/' in href:
-                        total_links_found += 1
-                        # Extract NREG from URL
-                        match = re.search(r'/laws/(?:show|card)/([^"\s<>\.\?&#]+)', href)
-                        if match:
-                            nreg = match.group(1)
-                            nreg = nreg.replace('.json', '').replace('.txt', '').replace('.html', '')
-                            if '?' in nreg:
-                                nreg = nreg.split('?')[0]
-                            
-                            try:
-                                decoded_nreg = unquote(nreg)
-                            except:
-                                decoded_nreg = nreg
-                            
-                            # Skip if already seen
-                            if decoded_nreg in seen_nregs:
-                                continue
-                            
-                            # For list pages, use more lenient validation
-                            is_valid = self._is_valid_nreg_for_list(decoded_nreg)
-                            if not is_valid:
-                                invalid_count += 1
-                                if invalid_count <= 5:  # Log first 5 invalid ones for debugging
-                                    logger.debug(f"Skipping invalid NREG from list: '{decoded_nreg}' (from href: {href})")
-                                continue
-                            
-                            seen_nregs.add(decoded_nreg)
-                            
-                            # Try to extract title from link text
-                            title = link.get_text(strip=True)
-                            if not title or len(title) < 3:
-                                title = decoded_nreg
-                            
-                            documents.append({
-                                "nreg": decoded_nreg,
-                                "title": title,
-                                "url": f"{self.base_url}/laws/show/{decoded_nreg}",
-                                "card_url": f"{self.base_url}/laws/card/{decoded_nreg}.json"
-                            })
-                
-                # Apply pagination
-                if skip > 0:
-                    documents = documents[skip:]
-                if limit:
-                    documents = documents[:limit]
-                
-                logger.info(f"Found {total_links_found} links, {len(documents)} valid documents, {invalid_count} invalid NREGs filtered out")
-                
-                # If no documents found, log sample of HTML for debugging
-                if len(documents) == 0 and total_links_found == 0:
-                    # Try to find any links in the HTML
-                    all_links = soup.find_all('a', href=True)
-                    logger.warning(f"No document links found. Total links in HTML: {len(all_links)}")
-                    if len(all_links) > 0:
-                        sample_links = [link.get('href', '')[:100] for link in all_links[:5]]
-                        logger.debug(f"Sample links found: {sample_links}")
-                
-                return documents
-                
+            client = self._get_client()
+            headers = self._get_headers(use_token=False)  # HTML lists don't need token
+            response = await client.get(url, headers=headers, timeout=60.0, follow_redirects=True)
+            
+            if response.status_code != 200:
+                logger.error(f"Failed to get documents list: {response.status_code}")
+                return []
+            
+            from bs4 import BeautifulSoup
+            
+            soup = BeautifulSoup(response.text, 'html.parser')
+            documents = []
+            seen_nregs = set()
+            invalid_count = 0
+            total_links_found = 0
+            
+            logger.info(f"Parsing HTML from {url}, HTML length: {len(response.text)}")
+            
+            # Find all document links
+            for link in soup.find_all('a', href=True):
+                href = link.get('href', '')
+                if '/laws/show/' in href or '/laws/card/' in href:
+                    total_links_found += 1
+                    # Extract NREG from URL
+                    match = re.search(r'/laws/(?:show|card)/([^"\s<>\.\?&#]+)', href)
+                    if match:
+                        nreg = match.group(1)
+                        nreg = nreg.replace('.json', '').replace('.txt', '').replace('.html', '')
+                        if '?' in nreg:
+                            nreg = nreg.split('?')[0]
+                        
+                        try:
+                            decoded_nreg = unquote(nreg)
+                        except:
+                            decoded_nreg = nreg
+                        
+                        # Skip if already seen
+                        if decoded_nreg in seen_nregs:
+                            continue
+                        
+                        # For list pages, use more lenient validation
+                        is_valid = self._is_valid_nreg_for_list(decoded_nreg)
+                        if not is_valid:
+                            invalid_count += 1
+                            if invalid_count <= 5:  # Log first 5 invalid ones for debugging
+                                logger.debug(f"Skipping invalid NREG from list: '{decoded_nreg}' (from href: {href})")
+                            continue
+                        
+                        seen_nregs.add(decoded_nreg)
+                        
+                        # Try to extract title from link text
+                        title = link.get_text(strip=True)
+                        if not title or len(title) < 3:
+                            title = decoded_nreg
+                        
+                        documents.append({
+                            "nreg": decoded_nreg,
+                            "title": title,
+                            "url": f"{self.base_url}/laws/show/{decoded_nreg}",
+                            "card_url": f"{self.base_url}/laws/card/{decoded_nreg}.json"
+                        })
+            
+            # Apply pagination
+            if skip > 0:
+                documents = documents[skip:]
+            if limit:
+                documents = documents[:limit]
+            
+            logger.info(f"Found {total_links_found} links, {len(documents)} valid documents, {invalid_count} invalid NREGs filtered out")
+            
+            # If no documents found, log sample of HTML for debugging
+            if len(documents) == 0 and total_links_found == 0:
+                # Try to find any links in the HTML
+                all_links = soup.find_all('a', href=True)
+                logger.warning(f"No document links found. Total links in HTML: {len(all_links)}")
+                if len(all_links) > 0:
+                    sample_links = [link.get('href', '')[:100] for link in all_links[:5]]
+                    logger.debug(f"Sample links found: {sample_links}")
+            
+            return documents
+        
         except Exception as e:
             logger.error(f"Error getting {list_type} documents list: {e}", exc_info=True)
             return []
@@ -463,21 +490,20 @@ class RadaAPIService:
         await self._rate_limit()
         
         try:
-            async with httpx.AsyncClient() as client:
-                url = f"{self.base_url}/laws/main/r"
-                headers = self._get_headers(use_token=False)
-                
-                response = await client.get(url, headers=headers, timeout=30.0)
-                
-                if response.status_code == 200:
-                    # Парсимо HTML для отримання списку nreg
-                    # Це спрощена версія, може знадобитися більш складний парсинг
-                    import re
-                    nregs = re.findall(r'/laws/show/([^"]+)', response.text)
-                    return list(set(nregs))
-                else:
-                    logger.error(f"Error getting updated list: {response.status_code}")
-                    return []
+            client = self._get_client()
+            url = f"{self.base_url}/laws/main/r"
+            headers = self._get_headers(use_token=False)
+            
+            response = await client.get(url, headers=headers, timeout=30.0)
+            
+            if response.status_code == 200:
+                # Парсимо HTML для отримання списку nreg
+                # Це спрощена версія, може знадобитися більш складний парсинг
+                nregs = re.findall(r'/laws/show/([^"]+)', response.text)
+                return list(set(nregs))
+            else:
+                logger.error(f"Error getting updated list: {response.status_code}")
+                return []
         except Exception as e:
             logger.error(f"Exception getting updated list: {e}")
             return []
@@ -487,64 +513,62 @@ class RadaAPIService:
         await self._rate_limit()
         
         try:
-            async with httpx.AsyncClient() as client:
-                if days == 1:
-                    url = f"{self.base_url}/laws/main/nn"  # За день
-                else:
-                    url = f"{self.base_url}/laws/main/n"  # За 30 днів
+            client = self._get_client()
+            if days == 1:
+                url = f"{self.base_url}/laws/main/nn"  # За день
+            else:
+                url = f"{self.base_url}/laws/main/n"  # За 30 днів
+            
+            headers = self._get_headers(use_token=False)
+            response = await client.get(url, headers=headers, timeout=30.0, follow_redirects=True)
+            
+            if response.status_code == 200:
+                from bs4 import BeautifulSoup
                 
-                headers = self._get_headers(use_token=False)
-                response = await client.get(url, headers=headers, timeout=30.0, follow_redirects=True)
+                # Try BeautifulSoup first
+                soup = BeautifulSoup(response.text, 'html.parser')
+                nregs = []
                 
-                if response.status_code == 200:
-                    import re
-                    from bs4 import BeautifulSoup
-                    from urllib.parse import unquote
-                    
-                    # Try BeautifulSoup first
-                    soup = BeautifulSoup(response.text, 'html.parser')
-                    nregs = []
-                    
-                    # Find all links to /laws/show/{nreg}
-                    for link in soup.find_all('a', href=True):
-                        href = link.get('href', '')
-                        if '/laws/show/' in href:
-                            match = re.search(r'/laws/show/([^"\s<>\.\?&#]+)', href)
-                            if match:
-                                nreg = match.group(1)
-                                nreg = nreg.replace('.json', '').replace('.txt', '').replace('.html', '')
-                                if '?' in nreg:
-                                    nreg = nreg.split('?')[0]
-                                if nreg and nreg not in nregs:
-                                    try:
-                                        decoded = unquote(nreg)
-                                        nregs.append(decoded)
-                                    except:
-                                        nregs.append(nreg)
-                    
-                    # Fallback to regex if BeautifulSoup didn't find anything
-                    if not nregs:
-                        nregs = re.findall(r'/laws/show/([^"\s<>\.\?&#]+)', response.text)
-                        # Decode and clean
-                        decoded_nregs = []
-                        for nreg in nregs:
-                            try:
-                                decoded = unquote(nreg)
-                                decoded = decoded.replace('.json', '').replace('.txt', '').replace('.html', '')
-                                if '?' in decoded:
-                                    decoded = decoded.split('?')[0]
-                                if decoded and decoded not in decoded_nregs:
-                                    decoded_nregs.append(decoded)
-                            except:
-                                if nreg not in decoded_nregs:
-                                    decoded_nregs.append(nreg)
-                        nregs = decoded_nregs
-                    
-                    logger.info(f"Found {len(nregs)} documents from new documents list")
-                    return list(set(nregs))  # Remove duplicates
-                else:
-                    logger.error(f"Error getting new list: {response.status_code}")
-                    return []
+                # Find all links to /laws/show/{nreg}
+                for link in soup.find_all('a', href=True):
+                    href = link.get('href', '')
+                    if '/laws/show/' in href:
+                        match = re.search(r'/laws/show/([^"\s<>\.\?&#]+)', href)
+                        if match:
+                            nreg = match.group(1)
+                            nreg = nreg.replace('.json', '').replace('.txt', '').replace('.html', '')
+                            if '?' in nreg:
+                                nreg = nreg.split('?')[0]
+                            if nreg and nreg not in nregs:
+                                try:
+                                    decoded = unquote(nreg)
+                                    nregs.append(decoded)
+                                except:
+                                    nregs.append(nreg)
+                
+                # Fallback to regex if BeautifulSoup didn't find anything
+                if not nregs:
+                    nregs = re.findall(r'/laws/show/([^"\s<>\.\?&#]+)', response.text)
+                    # Decode and clean
+                    decoded_nregs = []
+                    for nreg in nregs:
+                        try:
+                            decoded = unquote(nreg)
+                            decoded = decoded.replace('.json', '').replace('.txt', '').replace('.html', '')
+                            if '?' in decoded:
+                                decoded = decoded.split('?')[0]
+                            if decoded and decoded not in decoded_nregs:
+                                decoded_nregs.append(decoded)
+                        except:
+                            if nreg not in decoded_nregs:
+                                decoded_nregs.append(nreg)
+                    nregs = decoded_nregs
+                
+                logger.info(f"Found {len(nregs)} documents from new documents list")
+                return list(set(nregs))  # Remove duplicates
+            else:
+                logger.error(f"Error getting new list: {response.status_code}")
+                return []
         except Exception as e:
             logger.error(f"Exception getting new list: {e}", exc_info=True)
             return []
@@ -578,68 +602,103 @@ class RadaAPIService:
             consecutive_empty_pages = 0
             max_consecutive_empty = 3  # Stop after 3 empty pages in a row
             
-            async with httpx.AsyncClient() as client:
-                while page <= max_pages:
-                    await self._rate_limit()
-                    
-                    # Try different URL formats for pagination
-                    # API might use different pagination formats
-                    if page == 1:
-                        # Try multiple first page formats
-                        urls_to_try = [
-                            f"{self.base_url}/laws/main/r",
-                            f"{self.base_url}/laws/main",
-                            f"{self.base_url}/laws",
-                        ]
-                    else:
-                        # Try different pagination formats
-                        urls_to_try = [
-                            f"{self.base_url}/laws/main/r?page={page}",
-                            f"{self.base_url}/laws/main/r/{page}",
-                            f"{self.base_url}/laws/main?page={page}",
-                            f"{self.base_url}/laws?page={page}",
-                        ]
-                    
-                    # Use first URL for now, but log all options
-                    url = urls_to_try[0]
-                    if page == 1 and len(urls_to_try) > 1:
-                        logger.debug(f"Page {page}: Will try URLs: {urls_to_try}")
-                    
-                    headers = self._get_headers(use_token=False)
-                    logger.info(f"Fetching page {page} from {url}")
+            client = self._get_client()
+            while page <= max_pages:
+                await self._rate_limit()
+                
+                # Try different URL formats for pagination
+                # API might use different pagination formats
+                if page == 1:
+                    # Try multiple first page formats
+                    urls_to_try = [
+                        f"{self.base_url}/laws/main/r",
+                        f"{self.base_url}/laws/main",
+                        f"{self.base_url}/laws",
+                    ]
+                else:
+                    # Try different pagination formats
+                    urls_to_try = [
+                        f"{self.base_url}/laws/main/r?page={page}",
+                        f"{self.base_url}/laws/main/r/{page}",
+                        f"{self.base_url}/laws/main?page={page}",
+                        f"{self.base_url}/laws?page={page}",
+                    ]
+                
+                # Use first URL for now, but log all options
+                url = urls_to_try[0]
+                if page == 1 and len(urls_to_try) > 1:
+                    logger.debug(f"Page {page}: Will try URLs: {urls_to_try}")
+                
+                headers = self._get_headers(use_token=False)
+                logger.info(f"Fetching page {page} from {url}")
+                
+                try:
+                    response = await client.get(url, headers=headers, timeout=60.0, follow_redirects=True)
                     
-                    try:
-                        response = await client.get(url, headers=headers, timeout=60.0, follow_redirects=True)
+                    if response.status_code == 200:
+                        from bs4 import BeautifulSoup
                         
-                        if response.status_code == 200:
-                            import re
-                            from urllib.parse import unquote
-                            from bs4 import BeautifulSoup
-                            
-                            # Log response length for debugging
-                            response_length = len(response.text)
-                            logger.debug(f"Page {page}: Response length: {response_length} bytes")
-                            
-                            # Check if response is actually HTML
-                            if response_length < 100:
-                                logger.warning(f"Page {page}: Response too short ({response_length} bytes), might be empty or error")
-                            
-                            soup = BeautifulSoup(response.text, 'html.parser')
-                            page_nregs = []
+                        # Log response length for debugging
+                        response_length = len(response.text)
+                        logger.debug(f"Page {page}: Response length: {response_length} bytes")
+                        
+                        # Check if response is actually HTML
+                        if response_length < 100:
+                            logger.warning(f"Page {page}: Response too short ({response_length} bytes), might be empty or error")
+                        
+                        soup = BeautifulSoup(response.text, 'html.parser')
+                        page_nregs = []
+                        
+                        # Method 1: Find all <a> tags with href containing /laws/show/
+                        links_found = 0
+                        for link in soup.find_all('a', href=True):
+                            href = link.get('href', '')
+                            if '/laws/show/' in href:
+                                links_found += 1
+                                match = re.search(r'/laws/show/([^"\s<>\.\?&#]+)', href)
+                                if match:
+                                    nreg = match.group(1)
+                                    nreg = nreg.replace('.json', '').replace('.txt', '').replace('.html', '')
+                                    if '?' in nreg:
+                                        nreg = nreg.split('?')[0]
+                                    if nreg:
+                                        try:
+                                            decoded = unquote(nreg)
+                                            if decoded not in seen_nregs:
+                                                seen_nregs.add(decoded)
+                                                page_nregs.append(decoded)
+                                        except:
+                                            if nreg not in seen_nregs:
+                                                seen_nregs.add(nreg)
+                                                page_nregs.append(nreg)
+                        
+                        logger.debug(f"Page {page}: Found {links_found} links with /laws/show/, extracted {len(page_nregs)} unique nregs")
+                        
+                        # Method 2: Regex fallback (more aggressive)
+                        if not page_nregs:
+                            # Try multiple regex patterns
+                            patterns = [
+                                r'/laws/show/([^"\s<>\.\?&#]+)',
+                                r'/laws/show/([^/]+)',
+                                r'href=["\']([^"\']*laws/show/([^"\']+))',
+                                r'"/laws/show/([^"]+)"',
+                            ]
                             
-                            # Method 1: Find all <a> tags with href containing /laws/show/
-                            links_found = 0
-                            for link in soup.find_all('a', href=True):
-                                href = link.get('href', '')
-                                if '/laws/show/' in href:
-                                    links_found += 1
-                                    match = re.search(r'/laws/show/([^"\s<>\.\?&#]+)', href)
-                                    if match:
-                                        nreg = match.group(1)
+                            for pattern in patterns:
+                                matches = re.findall(pattern, response.text)
+                                if matches:
+                                    logger.debug(f"Page {page}: Regex pattern '{pattern}' found {len(matches)} matches")
+                                    for match in matches:
+                                        # Handle tuple matches (from groups)
+                                        if isinstance(match, tuple):
+                                            nreg = match[-1]  # Take last group
+                                        else:
+                                            nreg = match
+                                        
                                         nreg = nreg.replace('.json', '').replace('.txt', '').replace('.html', '')
                                         if '?' in nreg:
                                             nreg = nreg.split('?')[0]
-                                        if nreg:
+                                        if nreg and len(nreg) > 2:  # Filter out too short matches
                                             try:
                                                 decoded = unquote(nreg)
                                                 if decoded not in seen_nregs:
@@ -649,89 +708,52 @@ class RadaAPIService:
                                                 if nreg not in seen_nregs:
                                                     seen_nregs.add(nreg)
                                                     page_nregs.append(nreg)
+                                    
+                                    if page_nregs:
+                                        break  # Stop if we found something
                             
-                            logger.debug(f"Page {page}: Found {links_found} links with /laws/show/, extracted {len(page_nregs)} unique nregs")
-                            
-                            # Method 2: Regex fallback (more aggressive)
                             if not page_nregs:
-                                # Try multiple regex patterns
-                                patterns = [
-                                    r'/laws/show/([^"\s<>\.\?&#]+)',
-                                    r'/laws/show/([^/]+)',
-                                    r'href=["\']([^"\']*laws/show/([^"\']+))',
-                                    r'"/laws/show/([^"]+)"',
-                                ]
-                                
-                                for pattern in patterns:
-                                    matches = re.findall(pattern, response.text)
-                                    if matches:
-                                        logger.debug(f"Page {page}: Regex pattern '{pattern}' found {len(matches)} matches")
-                                        for match in matches:
-                                            # Handle tuple matches (from groups)
-                                            if isinstance(match, tuple):
-                                                nreg = match[-1]  # Take last group
-                                            else:
-                                                nreg = match
-                                            
-                                            nreg = nreg.replace('.json', '').replace('.txt', '').replace('.html', '')
-                                            if '?' in nreg:
-                                                nreg = nreg.split('?')[0]
-                                            if nreg and len(nreg) > 2:  # Filter out too short matches
-                                                try:
-                                                    decoded = unquote(nreg)
-                                                    if decoded not in seen_nregs:
-                                                        seen_nregs.add(decoded)
-                                                        page_nregs.append(decoded)
-                                                except:
-                                                    if nreg not in seen_nregs:
-                                                        seen_nregs.add(nreg)
-                                                        page_nregs.append(nreg)
-                                        
-                                        if page_nregs:
-                                            break  # Stop if we found something
-                                
-                                if not page_nregs:
-                                    # Log sample of response for debugging
-                                    sample = response.text[:500] if len(response.text) > 500 else response.text
-                                    logger.warning(f"Page {page}: No nregs found. Response sample: {sample[:200]}...")
-                            
-                            if page_nregs:
-                                all_nregs.extend(page_nregs)
-                                logger.info(f"Page {page}: Found {len(page_nregs)} new documents (total: {len(all_nregs)})")
-                                consecutive_empty_pages = 0
-                                
-                                # Check limit
-                                if limit and len(all_nregs) >= limit:
-                                    all_nregs = all_nregs[:limit]
-                                    logger.info(f"Reached limit of {limit} documents")
-                                    break
-                            else:
-                                consecutive_empty_pages += 1
-                                logger.info(f"Page {page}: No documents found (consecutive empty: {consecutive_empty_pages})")
-                                
-                                if consecutive_empty_pages >= max_consecutive_empty:
-                                    logger.info(f"Stopping after {consecutive_empty_pages} consecutive empty pages")
-                                    break
-                            
-                            page += 1
+                                # Log sample of response for debugging
+                                sample = response.text[:500] if len(response.text) > 500 else response.text
+                                logger.warning(f"Page {page}: No nregs found. Response sample: {sample[:200]}...")
+                        
+                        if page_nregs:
+                            all_nregs.extend(page_nregs)
+                            logger.info(f"Page {page}: Found {len(page_nregs)} new documents (total: {len(all_nregs)})")
+                            consecutive_empty_pages = 0
                             
-                        elif response.status_code == 404:
-                            logger.info(f"Page {page} returned 404, no more pages")
-                            break
+                            # Check limit
+                            if limit and len(all_nregs) >= limit:
+                                all_nregs = all_nregs[:limit]
+                                logger.info(f"Reached limit of {limit} documents")
+                                break
                         else:
-                            logger.warning(f"Page {page} returned status {response.status_code}")
                             consecutive_empty_pages += 1
+                            logger.info(f"Page {page}: No documents found (consecutive empty: {consecutive_empty_pages})")
+                            
                             if consecutive_empty_pages >= max_consecutive_empty:
+                                logger.info(f"Stopping after {consecutive_empty_pages} consecutive empty pages")
                                 break
-                            page += 1
-                            
-                    except Exception as e:
-                        logger.error(f"Error fetching page {page}: {e}")
+                        
+                        page += 1
+                    
+                    elif response.status_code == 404:
+                        logger.info(f"Page {page} returned 404, no more pages")
+                        break
+                    else:
+                        logger.warning(f"Page {page} returned status {response.status_code}")
                         consecutive_empty_pages += 1
                         if consecutive_empty_pages >= max_consecutive_empty:
                             break
                         page += 1
-                        continue
+                
+                except Exception as e:
+                    logger.error(f"Error fetching page {page}: {e}")
+                    consecutive_empty_pages += 1
+                    if consecutive_empty_pages >= max_consecutive_empty:
+                        break
+                    page += 1
+                    continue
             
             if not all_nregs:
                 logger.warning("No documents found with pagination, trying fallback methods...")
@@ -782,7 +804,6 @@ class RadaAPIService:
             unique_nregs = []
             for nreg in all_nregs:
                 try:
-                    from urllib.parse import unquote
                     decoded = unquote(nreg)
                     if decoded not in seen:
                         seen.add(decoded)
@@ -799,7 +820,7 @@ class RadaAPIService:
             
             logger.info(f"Total unique documents found: {len(unique_nregs)}")
             return unique_nregs
-            
+        
         except Exception as e:
             logger.error(f"Exception getting all documents list: {e}", exc_info=True)
             return []
@@ -812,34 +833,34 @@ class RadaAPIService:
         await self._rate_limit()
         
         try:
-            async with httpx.AsyncClient() as client:
-                # Try to get catalog in JSON format
-                # The catalog might be at /ogd/ or /open/main/registry
-                catalog_urls = [
-                    "https://data.rada.gov.ua/ogd/registry.json",
-                    "https://data.rada.gov.ua/open/main/registry.json",
-                    "https://data.rada.gov.ua/ogd/catalog.json",
-                ]
-                
-                headers = self._get_headers(use_token=False)
-                
-                for url in catalog_urls:
-                    try:
-                        logger.info(f"Trying to fetch catalog from {url}")
-                        response = await client.get(url, headers=headers, timeout=30.0, follow_redirects=True)
-                        
-                        if response.status_code == 200:
-                            content_type = response.headers.get("content-type", "").lower()
-                            if "application/json" in content_type or "text/json" in content_type:
-                                data = response.json()
-                                logger.info(f"Successfully fetched catalog from {url}")
-                                return data
-                    except Exception as e:
-                        logger.debug(f"Failed to fetch from {url}: {e}")
-                        continue
-                
-                logger.warning("Could not fetch catalog in JSON format, trying HTML parsing")
-                return None
+            client = self._get_client()
+            # Try to get catalog in JSON format
+            # The catalog might be at /ogd/ or /open/main/registry
+            catalog_urls = [
+                "https://data.rada.gov.ua/ogd/registry.json",
+                "https://data.rada.gov.ua/open/main/registry.json",
+                "https://data.rada.gov.ua/ogd/catalog.json",
+            ]
+            
+            headers = self._get_headers(use_token=False)
+            
+            for url in catalog_urls:
+                try:
+                    logger.info(f"Trying to fetch catalog from {url}")
+                    response = await client.get(url, headers=headers, timeout=30.0, follow_redirects=True)
+                    
+                    if response.status_code == 200:
+                        content_type = response.headers.get("content-type", "").lower()
+                        if "application/json" in content_type or "text/json" in content_type:
+                            data = response.json()
+                            logger.info(f"Successfully fetched catalog from {url}")
+                            return data
+                except Exception as e:
+                    logger.debug(f"Failed to fetch from {url}: {e}")
+                    continue
+            
+            logger.warning("Could not fetch catalog in JSON format, trying HTML parsing")
+            return None
         except Exception as e:
             logger.error(f"Error fetching open data catalog: {e}")
             return None
@@ -856,61 +877,59 @@ class RadaAPIService:
         await self._rate_limit()
         
         try:
-            async with httpx.AsyncClient() as client:
-                # Try multiple URL patterns
-                urls_to_try = [
-                    f"https://data.rada.gov.ua/open/data/{dataset_id}.{format}",
-                    f"https://data.rada.gov.ua/ogd/zak/{dataset_id}/list.{format}",
-                    f"https://data.rada.gov.ua/ogd/zak/{dataset_id}.{format}",
-                ]
-                
-                headers = self._get_headers(use_token=False)
-                
-                for url in urls_to_try:
-                    try:
-                        logger.debug(f"Trying to fetch dataset from {url}")
-                        
-                        # Add If-Modified-Since header if we have cached version
-                        # (for future optimization)
-                        
-                        response = await client.get(url, headers=headers, timeout=60.0, follow_redirects=True)
-                        
-                        if response.status_code == 200:
-                            if format == "json":
-                                data = response.json()
-                                logger.info(f"✅ Successfully fetched dataset {dataset_id} from {url}")
-                                return data
-                            elif format == "csv":
-                                import csv
-                                import io
-                                # Parse CSV to list of dicts
-                                text = response.text
-                                reader = csv.DictReader(io.StringIO(text))
-                                data = list(reader)
-                                logger.info(f"✅ Successfully fetched dataset {dataset_id} from {url}")
-                                return data
-                            elif format == "xml":
-                                # Return raw XML text for now
-                                logger.info(f"✅ Successfully fetched dataset {dataset_id} from {url}")
-                                return {"xml": response.text}
-                            else:
-                                logger.info(f"✅ Successfully fetched dataset {dataset_id} from {url}")
-                                return {"text": response.text}
-                        elif response.status_code == 304:
-                            logger.info(f"Dataset {dataset_id} not modified (304)")
-                            return None
-                        elif response.status_code == 404:
-                            logger.debug(f"URL {url} returned 404, trying next URL...")
-                            continue
+            client = self._get_client()
+            # Try multiple URL patterns
+            urls_to_try = [
+                f"https://data.rada.gov.ua/open/data/{dataset_id}.{format}",
+                f"https://data.rada.gov.ua/ogd/zak/{dataset_id}/list.{format}",
+                f"https://data.rada.gov.ua/ogd/zak/{dataset_id}.{format}",
+            ]
+            
+            headers = self._get_headers(use_token=False)
+            
+            for url in urls_to_try:
+                try:
+                    logger.debug(f"Trying to fetch dataset from {url}")
+                    
+                    # Add If-Modified-Since header if we have cached version
+                    # (for future optimization)
+                    
+                    response = await client.get(url, headers=headers, timeout=60.0, follow_redirects=True)
+                    
+                    if response.status_code == 200:
+                        if format == "json":
+                            data = response.json()
+                            logger.info(f"✅ Successfully fetched dataset {dataset_id} from {url}")
+                            return data
+                        elif format == "csv":
+                            # Parse CSV to list of dicts
+                            text = response.text
+                            reader = csv.DictReader(io.StringIO(text))
+                            data = list(reader)
+                            logger.info(f"✅ Successfully fetched dataset {dataset_id} from {url}")
+                            return data
+                        elif format == "xml":
+                            # Return raw XML text for now
+                            logger.info(f"✅ Successfully fetched dataset {dataset_id} from {url}")
+                            return {"xml": response.text}
                         else:
-                            logger.warning(f"URL {url} returned status {response.status_code}")
-                            continue
-                    except Exception as e:
-                        logger.debug(f"Error fetching from {url}: {e}, trying next URL...")
+                            logger.info(f"✅ Successfully fetched dataset {dataset_id} from {url}")
+                            return {"text": response.text}
+                    elif response.status_code == 304:
+                        logger.info(f"Dataset {dataset_id} not modified (304)")
+                        return None
+                    elif response.status_code == 404:
+                        logger.debug(f"URL {url} returned 404, trying next URL...")
                         continue
-                
-                logger.warning(f"Failed to fetch dataset {dataset_id} from all tried URLs")
-                return None
+                    else:
+                        logger.warning(f"URL {url} returned status {response.status_code}")
+                        continue
+                except Exception as e:
+                    logger.debug(f"Error fetching from {url}: {e}, trying next URL...")
+                    continue
+            
+            logger.warning(f"Failed to fetch dataset {dataset_id} from all tried URLs")
+            return None
         except Exception as e:
             logger.error(f"Error fetching dataset {dataset_id}: {e}")
             return None
@@ -959,37 +978,36 @@ class RadaAPIService:
         for url in catalog_urls:
             await self._rate_limit()
             try:
-                async with httpx.AsyncClient() as client:
-                    headers = self._get_headers(use_token=False)
-                    response = await client.get(url, headers=headers, timeout=30.0, follow_redirects=True)
+                client = self._get_client()
+                headers = self._get_headers(use_token=False)
+                response = await client.get(url, headers=headers, timeout=30.0, follow_redirects=True)
+                
+                if response.status_code == 200:
+                    from bs4 import BeautifulSoup
                     
-                    if response.status_code == 200:
-                        from bs4 import BeautifulSoup
-                        import re
-                        
-                        soup = BeautifulSoup(response.text, 'html.parser')
+                    soup = BeautifulSoup(response.text, 'html.parser')
+                    
+                    # Look for links to legal acts datasets
+                    for link in soup.find_all('a', href=True):
+                        href = link.get('href', '')
+                        text = link.get_text().lower()
                         
-                        # Look for links to legal acts datasets
-                        for link in soup.find_all('a', href=True):
-                            href = link.get('href', '')
-                            text = link.get_text().lower()
+                        # Check if link contains dataset ID and text matches keywords
+                        if any(keyword in text for keyword in keywords):
+                            # Try different URL patterns
+                            patterns = [
+                                r'/open/data/(\d+)',
+                                r'/data/(\d+)',
+                                r'id[=:](\d+)',
+                                r'dataset[=:](\d+)',
+                            ]
                             
-                            # Check if link contains dataset ID and text matches keywords
-                            if any(keyword in text for keyword in keywords):
-                                # Try different URL patterns
-                                patterns = [
-                                    r'/open/data/(\d+)',
-                                    r'/data/(\d+)',
-                                    r'id[=:](\d+)',
-                                    r'dataset[=:](\d+)',
-                                ]
-                                
-                                for pattern in patterns:
-                                    match = re.search(pattern, href)
-                                    if match:
-                                        dataset_id = match.group(1)
-                                        logger.info(f"✅ Found potential legal acts dataset ID: {dataset_id} (from {url}, link: {text[:50]})")
-                                        return dataset_id
+                            for pattern in patterns:
+                                match = re.search(pattern, href)
+                                if match:
+                                    dataset_id = match.group(1)
+                                    logger.info(f"✅ Found potential legal acts dataset ID: {dataset_id} (from {url}, link: {text[:50]})")
+                                    return dataset_id
             except Exception as e:
                 logger.debug(f"Error searching {url}: {e}")
                 continue
@@ -1251,7 +1269,6 @@ class RadaAPIService:
         # Valid NREG should contain '/' or '-' (typical format: 254к/96-вр)
         if '/' in nreg or '-' in nreg:
             # Additional validation: should have numbers
-            import re
             if re.search(r'\d', nreg):
                 return True
         
@@ -1376,8 +1393,6 @@ class RadaAPIService:
                 
                 if response.status_code == 200:
                     from bs4 import BeautifulSoup
-                    import re
-                    from urllib.parse import unquote
                     
                     soup = BeautifulSoup(response.text, 'html.parser')
                     page_nregs = []
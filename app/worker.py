@@ -0,0 +1,42 @@
+"""
+arq worker for background jobs
+
+Run with: arq app.worker.WorkerSettings  (requires REDIS_URL)
+"""
+from arq.connections import RedisSettings
+from app.core.config import settings
+from app.services import jobs
+from app.services.rada_api import rada_api
+
+
+async def download_dataset_documents(ctx, dataset_id=None, limit=None):
+    return await jobs.download_dataset_documents(dataset_id, limit)
+
+
+async def sync_all_dataset_acts(ctx):
+    return await jobs.sync_all_dataset_acts()
+
+
+async def download_active_acts(ctx, process=False):
+    return await jobs.download_active_acts(process)
+
+
+async def process_legal_act(ctx, nreg, force_reprocess=False):
+    return await jobs.process_legal_act(nreg, force_reprocess)
+
+
+async def shutdown(ctx):
+    await rada_api.close()
+
+
+class WorkerSettings:
+    functions = [
+        download_dataset_documents,
+        sync_all_dataset_acts,
+        download_active_acts,
+        process_legal_act,
+    ]
+    redis_settings = RedisSettings.from_dsn(settings.REDIS_URL or "redis://localhost:6379")
+    on_shutdown = shutdown
+    max_jobs = 4
+    job_timeout = 12 * 60 * 60  # whole-dataset imports run for hours
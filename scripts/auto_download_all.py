@@ -13,6 +13,7 @@ from tqdm import tqdm
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from sqlalchemy import select
 from app.core.database import SessionLocal
 from app.models.legal_act import LegalAct
 from app.services.rada_api import rada_api
@@ -50,10 +51,9 @@ class AutoDownloader:
     def load_processed_nregs(self):
         """Завантажити список вже оброблених NREG з БД"""
         try:
-            acts = self.db.query(LegalAct.nreg).filter(
-                LegalAct.is_processed == True
-            ).all()
-            self.processed_nregs = {act[0] for act in acts}
+            self.processed_nregs = set(self.db.scalars(
+                select(LegalAct.nreg).where(LegalAct.is_processed == True)
+            ))
             logger.info(f"Loaded {len(self.processed_nregs)} already processed documents")
         except Exception as e:
             logger.error(f"Error loading processed nregs: {e}")
@@ -16,6 +16,7 @@ from app.core.database import SessionLocal
 from app.models.legal_act import LegalAct
 from app.services.rada_api import rada_api
 from app.services.processing_service import ProcessingService
+from app.services.jobs import filter_unprocessed
 from app.core.config import settings
 
 logging.basicConfig(
@@ -107,14 +108,8 @@ class ContinuousDownloader:
             logger.info("No new documents found")
             return
         
-        # Фільтрувати вже оброблені
-        to_process = []
-        for nreg in new_nregs:
-            if shutdown:
-                break
-            act = self.db.query(LegalAct).filter(LegalAct.nreg == nreg).first()
-            if not act or not act.is_processed:
-                to_process.append(nreg)
+        # Фільтрувати вже оброблені - один IN запит на 1000 NREG замість запиту на кожен
+        to_process = filter_unprocessed(self.db, new_nregs)
         
         if not to_process:
             logger.info("All new documents already processed")
@@ -14,6 +14,7 @@ from tqdm import tqdm
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from sqlalchemy import select
 from app.core.database import SessionLocal
 from app.models.legal_act import LegalAct
 from app.services.rada_api import rada_api
@@ -45,6 +46,10 @@ ACTIVE_STATUSES = [
 ]
 
 
+# Скільки карток документів завантажувати одночасно при фільтрації
+CARD_FETCH_CONCURRENCY = 10
+
+
 def is_active_status(status: Optional[str]) -> bool:
     """Перевірити, чи статус вказує на діючий акт"""
     if status is None:
@@ -89,10 +94,9 @@ class ActiveActsDownloader:
     def load_processed_nregs(self):
         """Завантажити список вже оброблених NREG з БД"""
         try:
-            acts = self.db.query(LegalAct.nreg).filter(
-                LegalAct.is_processed == True
-            ).all()
-            self.processed_nregs = {act[0] for act in acts}
+            self.processed_nregs = set(self.db.scalars(
+                select(LegalAct.nreg).where(LegalAct.is_processed == True)
+            ))
             logger.info(f"Завантажено {len(self.processed_nregs)} вже оброблених документів")
         except Exception as e:
             logger.error(f"Помилка завантаження оброблених NREG: {e}")
@@ -123,35 +127,37 @@ class ActiveActsDownloader:
         
         active_nregs = []
         batch_size = 50  # Перевіряємо батчами для швидкості
+        # Картки батчу завантажуються паралельно - rada_api._rate_limit і далі розносить старти запитів
+        semaphore = asyncio.Semaphore(CARD_FETCH_CONCURRENCY)
+        
+        async def fetch_card(nreg: str):
+            async with semaphore:
+                return await rada_api.get_document_card(nreg)
         
         for i in range(0, len(nregs), batch_size):
             batch = nregs[i:i + batch_size]
+            cards = await asyncio.gather(*(fetch_card(nreg) for nreg in batch), return_exceptions=True)
             
-            for nreg in batch:
-                try:
-                    # Отримати картку документа для перевірки статусу
-                    card = await rada_api.get_document_card(nreg)
+            for nreg, card in zip(batch, cards):
+                if isinstance(card, Exception):
+                    logger.warning(f"Помилка перевірки статусу для {nreg}: {card}")
+                    # У разі помилки вважаємо діючим
+                    active_nregs.append(nreg)
+                    self.stats["active"] += 1
+                elif card:
+                    status = card.get("status") or card.get("Статус") or card.get("статус")
                     
-                    if card:
-                        status = card.get("status") or card.get("Статус") or card.get("статус")
-                        
-                        if is_active_status(status):
-                            active_nregs.append(nreg)
-                            self.stats["active"] += 1
-                        else:
-                            self.stats["inactive"] += 1
-                            logger.debug(f"Пропущено недіючий акт {nreg}: {status}")
-                    else:
-                        # Якщо не вдалося отримати картку, вважаємо діючим
+                    if is_active_status(status):
                         active_nregs.append(nreg)
                         self.stats["active"] += 1
-                        logger.debug(f"Не вдалося отримати статус для {nreg}, вважаємо діючим")
-                
-                except Exception as e:
-                    logger.warning(f"Помилка перевірки статусу для {nreg}: {e}")
-                    # У разі помилки вважаємо діючим
+                    else:
+                        self.stats["inactive"] += 1
+                        logger.debug(f"Пропущено недіючий акт {nreg}: {status}")
+                else:
+                    # Якщо не вдалося отримати картку, вважаємо діючим
                     active_nregs.append(nreg)
                     self.stats["active"] += 1
+                    logger.debug(f"Не вдалося отримати статус для {nreg}, вважаємо діючим")
             
             # Логування прогресу
             if (i + batch_size) % 500 == 0:
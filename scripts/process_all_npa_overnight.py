@@ -15,6 +15,7 @@ from tqdm import tqdm
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from sqlalchemy import select
 from app.core.database import SessionLocal
 from app.models.legal_act import LegalAct
 from app.services.rada_api import rada_api
@@ -152,8 +153,9 @@ class OvernightProcessor:
         total_nregs = await self.sync_all_nregs_to_db()
         
         # Отримуємо всі NREG з бази даних
-        all_acts = self.db.query(LegalAct).filter(LegalAct.is_processed == False).all()
-        nregs_to_process = [act.nreg for act in all_acts]
+        nregs_to_process = list(self.db.scalars(
+            select(LegalAct.nreg).where(LegalAct.is_processed == False)
+        ))
         
         self.stats["total_found"] = len(nregs_to_process)
         logger.info(f"📊 Знайдено {len(nregs_to_process)} НПА для обробки")
@@ -172,11 +174,14 @@ class OvernightProcessor:
                 
                 logger.info(f"📦 Обробка батча {i//batch_size + 1} ({len(batch)} актів)...")
                 
+                # Перевірка чи вже оброблено (на випадок паралельної обробки) - один запит на батч
+                already_processed = set(self.db.scalars(
+                    select(LegalAct.nreg).where(LegalAct.nreg.in_(batch), LegalAct.is_processed == True)
+                ))
+                
                 for nreg in batch:
                     try:
-                        # Перевірка чи вже оброблено (на випадок паралельної обробки)
-                        act = self.db.query(LegalAct).filter(LegalAct.nreg == nreg).first()
-                        if act and act.is_processed:
+                        if nreg in already_processed:
                             logger.info(f"⏭️  Акт {nreg} вже оброблено, пропускаємо")
                             self.stats["already_processed"] += 1
                             pbar.update(1)